@@ -225,15 +225,8 @@ class ArbitrageAnalyzer:
         arbitrage_pct = (1.0 - total) * 100
         direction = "under"
 
-        # Parse end_date if available
-        end_date = None
-        if market.end_date:
-            try:
-                # Handle ISO format with or without timezone
-                end_date_str = market.end_date.replace("Z", "+00:00")
-                end_date = datetime.fromisoformat(end_date_str).replace(tzinfo=None)
-            except (ValueError, AttributeError):
-                pass
+        # Parsed end_date if available
+        end_date = market.end_dt
 
         return ArbitrageOpportunity(
             market_id=market.id,
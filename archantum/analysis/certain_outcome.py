@@ -517,14 +517,9 @@ class CertainOutcomeDetector:
             if not price_data or price_data.yes_price is None:
                 continue
 
-            # Must have end_date
-            if not market.end_date:
-                continue
-
-            # Parse end date
-            try:
-                end_dt = datetime.fromisoformat(market.end_date.replace("Z", "+00:00")).replace(tzinfo=None)
-            except (ValueError, AttributeError):
+            # Must have a parseable end_date
+            end_dt = market.end_dt
+            if end_dt is None:
                 continue
 
             hours_left = (end_dt - now).total_seconds() / 3600
@@ -420,14 +420,9 @@ class DependencyAnalyzer:
         """Get the earliest end date across all markets in the event."""
         earliest = None
         for m in event_markets:
-            if not m.end_date:
-                continue
-            try:
-                end_dt = datetime.fromisoformat(m.end_date.replace("Z", "+00:00")).replace(tzinfo=None)
-                if earliest is None or end_dt < earliest:
-                    earliest = end_dt
-            except (ValueError, AttributeError):
-                continue
+            end_dt = m.end_dt
+            if end_dt is not None and (earliest is None or end_dt < earliest):
+                earliest = end_dt
         return earliest
 
     def _get_event_slug(self, market: GammaMarket) -> str | None:
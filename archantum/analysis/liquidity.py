@@ -110,11 +110,11 @@ class LiquidityAnalyzer:
         profile.best_ask = orderbook.best_ask
 
         # Calculate depth in USD
-        profile.bid_depth_usd = sum(l.price * l.size for l in orderbook.bids)
-        profile.ask_depth_usd = sum(l.price * l.size for l in orderbook.asks)
+        profile.bid_depth_usd = orderbook.bid_depth_usd
+        profile.ask_depth_usd = orderbook.ask_depth_usd
 
-        # Sort asks ascending (cheapest first) for buy-side VWAP
-        sorted_asks = sorted(orderbook.asks, key=lambda l: l.price)
+        # Asks come sorted ascending (cheapest first) for buy-side VWAP
+        sorted_asks = orderbook.asks
 
         # VWAP at different sizes
         for target, attr_vwap, attr_slip in [
@@ -152,25 +152,19 @@ class LiquidityAnalyzer:
         yes_profile = LiquidityProfile(token_id=market.yes_token_id)
         no_profile = LiquidityProfile(token_id=market.no_token_id)
 
-        # Fetch YES orderbook
-        if market.yes_token_id:
-            try:
-                yes_book = await clob_client.get_orderbook(market.yes_token_id)
-                yes_profile = self.build_liquidity_profile(
-                    yes_book, midpoint=opp.yes_price, token_id=market.yes_token_id
-                )
-            except Exception:
-                pass
-
-        # Fetch NO orderbook
-        if market.no_token_id:
-            try:
-                no_book = await clob_client.get_orderbook(market.no_token_id)
-                no_profile = self.build_liquidity_profile(
-                    no_book, midpoint=opp.no_price, token_id=market.no_token_id
-                )
-            except Exception:
-                pass
+        # Fetch both orderbooks at once
+        token_ids = [t for t in (market.yes_token_id, market.no_token_id) if t]
+        books = await clob_client.get_orderbooks(token_ids) if token_ids else {}
+
+        if market.yes_token_id in books:
+            yes_profile = self.build_liquidity_profile(
+                books[market.yes_token_id], midpoint=opp.yes_price, token_id=market.yes_token_id
+            )
+
+        if market.no_token_id in books:
+            no_profile = self.build_liquidity_profile(
+                books[market.no_token_id], midpoint=opp.no_price, token_id=market.no_token_id
+            )
 
         return LiquidityAdjustedArbitrage(
             opportunity=opp,
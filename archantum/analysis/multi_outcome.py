@@ -218,14 +218,9 @@ class MultiOutcomeAnalyzer:
         """Get the earliest end date across all markets in the event."""
         earliest = None
         for m in event_markets:
-            if not m.end_date:
-                continue
-            try:
-                end_dt = datetime.fromisoformat(m.end_date.replace("Z", "+00:00")).replace(tzinfo=None)
-                if earliest is None or end_dt < earliest:
-                    earliest = end_dt
-            except (ValueError, AttributeError):
-                continue
+            end_dt = m.end_dt
+            if end_dt is not None and (earliest is None or end_dt < earliest):
+                earliest = end_dt
         return earliest
 
     def _get_event_name(self, event_markets: list[GammaMarket]) -> str:
@@ -187,11 +187,11 @@ class PaperTradingEngine:
                 up_mid = await clob.get_midpoint(up_token)
                 down_mid = await clob.get_midpoint(down_token)
 
-                up_book = await clob.get_orderbook(up_token)
-                up_ask = up_book.best_ask
-
-                down_book = await clob.get_orderbook(down_token)
-                down_ask = down_book.best_ask
+                books = await clob.get_orderbooks([up_token, down_token])
+                if up_token in books:
+                    up_ask = books[up_token].best_ask
+                if down_token in books:
+                    down_ask = books[down_token].best_ask
         except Exception as e:
             console.print(f"[yellow]Paper trading: CLOB price fetch error: {e}[/yellow]")
 
@@ -4,6 +4,9 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import datetime, timedelta
+
+import numpy as np
+
 from archantum.config import settings
 from archantum.db import Database
 from archantum.api.clob import PriceData
@@ -58,16 +61,44 @@ class PriceAnalyzer:
         prices: dict[str, PriceData],
     ) -> list[PriceMovement]:
         """Find significant price movements across markets."""
-        movements = []
+        candidates = [
+            (market, price_data.yes_price)
+            for market in markets
+            if (price_data := prices.get(market.id)) is not None
+            and price_data.yes_price is not None
+        ]
+        if not candidates:
+            return []
+
+        # Reference snapshots for every candidate in one groupwise query
+        # (newest snapshot per market, kept only if inside the lookback window)
+        since = datetime.utcnow() - timedelta(minutes=self.lookback_minutes)
+        latest = await self.db.get_latest_price_snapshots(
+            [market.id for market, _ in candidates]
+        )
+
+        def previous_price(market_id: str) -> float:
+            snapshot = latest.get(market_id)
+            if snapshot is None or snapshot.timestamp < since or not snapshot.yes_price:
+                return np.nan
+            return snapshot.yes_price
 
-        for market in markets:
-            price_data = prices.get(market.id)
-            if not price_data:
-                continue
+        current = np.fromiter(
+            (yes_price for _, yes_price in candidates), dtype=np.float64, count=len(candidates)
+        )
+        previous = np.fromiter(
+            (previous_price(market.id) for market, _ in candidates),
+            dtype=np.float64,
+            count=len(candidates),
+        )
 
-            movement = await self.check_market(market, price_data)
-            if movement:
-                movements.append(movement)
+        # Threshold test over all markets at once; NaN (no usable reference)
+        # compares False and drops out
+        change = (current - previous) / previous
+        movements = [
+            self._build_movement(candidates[idx][0], current[idx], previous[idx])
+            for idx in np.flatnonzero(np.abs(change) >= self.threshold)
+        ]
 
         # Sort by absolute price change (highest first)
         movements.sort(key=lambda x: abs(x.price_change_pct), reverse=True)
@@ -98,15 +129,26 @@ class PriceAnalyzer:
             return None
 
         # Calculate price change
-        price_diff = current_price.yes_price - old_snapshot.yes_price
         if old_snapshot.yes_price == 0:
             return None
 
-        price_change_pct = price_diff / old_snapshot.yes_price
+        price_change_pct = (current_price.yes_price - old_snapshot.yes_price) / old_snapshot.yes_price
 
         if abs(price_change_pct) < self.threshold:
             return None
 
+        return self._build_movement(market, current_price.yes_price, old_snapshot.yes_price)
+
+    def _build_movement(
+        self,
+        market: GammaMarket,
+        current_yes_price: float,
+        previous_yes_price: float,
+    ) -> PriceMovement:
+        """Build a price movement from current and reference YES prices."""
+        current_yes_price = float(current_yes_price)
+        previous_yes_price = float(previous_yes_price)
+        price_diff = current_yes_price - previous_yes_price
         direction = "up" if price_diff > 0 else "down"
 
         return PriceMovement(
@@ -114,9 +156,9 @@ class PriceAnalyzer:
             question=market.question,
             slug=market.slug,
             polymarket_url=market.polymarket_url,
-            current_yes_price=current_price.yes_price,
-            previous_yes_price=old_snapshot.yes_price,
-            price_change_pct=price_change_pct * 100,
+            current_yes_price=current_yes_price,
+            previous_yes_price=previous_yes_price,
+            price_change_pct=price_diff / previous_yes_price * 100,
             direction=direction,
             time_span_minutes=self.lookback_minutes,
         )
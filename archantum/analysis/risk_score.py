@@ -5,6 +5,8 @@ from __future__ import annotations
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 
+import numpy as np
+
 from archantum.db import Database
 from archantum.analysis.arbitrage import ArbitrageOpportunity
 from archantum.analysis.liquidity import LiquidityProfile
@@ -111,17 +113,19 @@ class ExecutionRiskScorer:
         if len(snapshots) < 5:
             return 5.0  # Not enough data, assume average
 
-        prices = [s.yes_price for s in snapshots if s.yes_price is not None]
-        if len(prices) < 5:
+        prices = np.fromiter(
+            (s.yes_price for s in snapshots if s.yes_price is not None),
+            dtype=np.float64,
+        )
+        if prices.size < 5:
             return 5.0
 
         # Calculate standard deviation as % of mean
-        mean_price = sum(prices) / len(prices)
+        mean_price = prices.mean()
         if mean_price <= 0:
             return 5.0
 
-        variance = sum((p - mean_price) ** 2 for p in prices) / len(prices)
-        stddev = variance ** 0.5
+        stddev = prices.std()
         stddev_pct = (stddev / mean_price) * 100
 
         # Lower stddev = more stable = higher score
@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import cached_property
+from itertools import groupby
 from datetime import datetime, timedelta
 from typing import Optional
 
@@ -41,7 +43,7 @@ class MarketScoreResult:
     liquidity: float
     spread: float
 
-    @property
+    @cached_property
     def rank_tier(self) -> str:
         """Get tier based on total score."""
         if self.total_score >= 80:
@@ -87,10 +89,30 @@ class MarketScorer:
     WEIGHT_SPREAD = 0.15
     WEIGHT_ACTIVITY = 0.10
 
+    # Weights in component order: volume, volume trend, liquidity,
+    # volatility, spread, activity
+    WEIGHTS = np.array(
+        [
+            WEIGHT_VOLUME,
+            WEIGHT_VOLUME_TREND,
+            WEIGHT_LIQUIDITY,
+            WEIGHT_VOLATILITY,
+            WEIGHT_SPREAD,
+            WEIGHT_ACTIVITY,
+        ]
+    )
+
     # Thresholds for scoring
     VOLUME_THRESHOLDS = [1000, 5000, 25000, 100000, 500000]  # $
     LIQUIDITY_THRESHOLDS = [1000, 5000, 25000, 100000, 500000]  # $
     VOLATILITY_THRESHOLDS = [0.01, 0.03, 0.05, 0.10, 0.20]  # 1-20%
+    PERCENTILES = [25, 50, 75, 90, 99]
+
+    # Max market IDs per IN (...) clause when prefetching history
+    PREFETCH_CHUNK_SIZE = 500
+
+    # (timestamps, values) history for markets with no snapshots
+    _EMPTY_HISTORY = (np.empty(0, dtype="datetime64[us]"), np.empty(0, dtype=np.float64))
 
     def __init__(self, db: AsyncSession):
         self.db = db
@@ -104,63 +126,103 @@ class MarketScorer:
     ) -> list[MarketScoreResult]:
         """Score all markets and return ranked results."""
         results = []
+        now = datetime.utcnow()
 
         # Calculate percentile benchmarks from current batch
         volumes = [m.volume_24hr or 0 for m in markets if m.volume_24hr]
         liquidities = [m.liquidity or 0 for m in markets if m.liquidity]
 
+        # One np.percentile call per series sorts the data once for all cut points
         if volumes:
-            self._volume_percentiles = {
-                p: np.percentile(volumes, p) for p in [25, 50, 75, 90, 99]
-            }
+            self._volume_percentiles = dict(
+                zip(self.PERCENTILES, np.percentile(volumes, self.PERCENTILES))
+            )
         if liquidities:
-            self._liquidity_percentiles = {
-                p: np.percentile(liquidities, p) for p in [25, 50, 75, 90, 99]
-            }
-
-        for market in markets:
-            price_data = prices.get(market.id)
-            if not price_data:
-                continue
-
-            score = await self._score_market(market, price_data)
-            if score:
-                results.append(score)
+            self._liquidity_percentiles = dict(
+                zip(self.PERCENTILES, np.percentile(liquidities, self.PERCENTILES))
+            )
+
+        scorable = [m for m in markets if prices.get(m.id)]
+        if not scorable:
+            return results
+
+        # Prefetch history and previous scores for all markets up front so the
+        # per-market loop below does no DB round trips of its own
+        market_ids = [m.id for m in scorable]
+        price_histories = await self._get_price_histories(market_ids, now, hours=24)
+        volume_histories = await self._get_volume_histories(market_ids, now, hours=24)
+        previous_scores = await self._get_previous_scores(market_ids)
+
+        # Component scores for all markets as an (N, 6) matrix in WEIGHTS order,
+        # so the weighted totals come from a single matrix-vector product
+        components = np.array(
+            [
+                self._score_components(
+                    market,
+                    prices[market.id],
+                    price_histories.get(market.id, self._EMPTY_HISTORY),
+                    volume_histories.get(market.id, self._EMPTY_HISTORY),
+                    now,
+                )
+                for market in scorable
+            ],
+            dtype=np.float64,
+        )
+        totals = components @ self.WEIGHTS
+
+        for market, market_components, total_score in zip(
+            scorable, components.tolist(), totals.tolist()
+        ):
+            score = await self._build_result(
+                market,
+                prices[market.id],
+                market_components,
+                total_score,
+                previous_scores.get(market.id),
+            )
+            results.append(score)
 
         # Sort by total score descending
         results.sort(key=lambda x: x.total_score, reverse=True)
         return results
 
-    async def _score_market(
+    def _score_components(
         self,
         market: GammaMarket,
         price_data: PriceData,
-    ) -> MarketScoreResult | None:
-        """Score a single market."""
-        # Get historical data for trend/volatility calculations
-        price_history = await self._get_price_history(market.id, hours=24)
-        volume_history = await self._get_volume_history(market.id, hours=24)
-
-        # Calculate individual scores
-        volume_score = self._score_volume(market.volume_24hr or 0)
-        volume_trend_score = self._score_volume_trend(volume_history)
-        liquidity_score = self._score_liquidity(market.liquidity or 0)
-        volatility_score = self._score_volatility(price_history)
-        spread_score = self._score_spread(price_data)
-        activity_score = self._score_activity(price_history)
-
-        # Calculate weighted total
-        total_score = (
-            volume_score * self.WEIGHT_VOLUME
-            + volume_trend_score * self.WEIGHT_VOLUME_TREND
-            + liquidity_score * self.WEIGHT_LIQUIDITY
-            + volatility_score * self.WEIGHT_VOLATILITY
-            + spread_score * self.WEIGHT_SPREAD
-            + activity_score * self.WEIGHT_ACTIVITY
+        price_history: tuple[np.ndarray, np.ndarray],
+        volume_history: tuple[np.ndarray, np.ndarray],
+        now: datetime,
+    ) -> tuple[float, float, float, float, float, float]:
+        """Score a single market's components from prefetched history, in WEIGHTS order."""
+        return (
+            self._score_volume(market.volume_24hr or 0),
+            self._score_volume_trend(volume_history),
+            self._score_liquidity(market.liquidity or 0),
+            self._score_volatility(price_history),
+            self._score_spread(price_data),
+            self._score_activity(price_history, now),
         )
 
-        # Get previous score for change tracking
-        previous_score = await self._get_previous_score(market.id)
+    async def _build_result(
+        self,
+        market: GammaMarket,
+        price_data: PriceData,
+        components: list[float],
+        total_score: float,
+        previous_score: float | None,
+    ) -> MarketScoreResult:
+        """Save a market's score and build its result."""
+        (
+            volume_score,
+            volume_trend_score,
+            liquidity_score,
+            volatility_score,
+            spread_score,
+            activity_score,
+        ) = components
+
+        # Previous score for change tracking
         score_change = total_score - previous_score if previous_score else None
 
         # Save to database
@@ -220,17 +282,18 @@ class MarketScorer:
                 return (i / len(self.VOLUME_THRESHOLDS)) * 100
         return 100
 
-    def _score_volume_trend(self, volume_history: list[tuple[datetime, float]]) -> float:
+    def _score_volume_trend(self, volume_history: tuple[np.ndarray, np.ndarray]) -> float:
         """Score based on volume trend (0-100). Higher = growing volume."""
-        if len(volume_history) < 2:
+        _, volumes = volume_history
+        if len(volumes) < 2:
             return 50  # Neutral
 
         # Compare recent vs earlier volumes
-        recent = volume_history[-len(volume_history) // 2 :]
-        earlier = volume_history[: len(volume_history) // 2]
+        recent = volumes[-len(volumes) // 2 :]
+        earlier = volumes[: len(volumes) // 2]
 
-        recent_avg = np.mean([v for _, v in recent]) if recent else 0
-        earlier_avg = np.mean([v for _, v in earlier]) if earlier else 0
+        recent_avg = recent.mean() if recent.size else 0
+        earlier_avg = earlier.mean() if earlier.size else 0
 
         if earlier_avg <= 0:
             return 50
@@ -267,21 +330,23 @@ class MarketScorer:
                 return (i / len(self.LIQUIDITY_THRESHOLDS)) * 100
         return 100
 
-    def _score_volatility(self, price_history: list[tuple[datetime, float]]) -> float:
+    def _score_volatility(self, price_history: tuple[np.ndarray, np.ndarray]) -> float:
         """Score based on price volatility (0-100). Higher = more volatile."""
-        if len(price_history) < 5:
+        _, prices = price_history
+        if len(prices) < 5:
             return 50  # Neutral
 
-        prices = [p for _, p in price_history]
-        if not prices or max(prices) == min(prices):
+        if np.ptp(prices) == 0:
             return 50
 
-        # Calculate standard deviation as % of mean
-        mean_price = np.mean(prices)
+        # Calculate standard deviation as % of mean, reusing the mean rather
+        # than letting np.std recompute it
+        mean_price = prices.mean()
         if mean_price <= 0:
             return 50
 
-        std_dev = np.std(prices)
+        deviations = prices - mean_price
+        std_dev = np.sqrt(np.dot(deviations, deviations) / len(prices))
         volatility = std_dev / mean_price
 
         # Map volatility to score
@@ -313,17 +378,22 @@ class MarketScorer:
             return 20
         return 0
 
-    def _score_activity(self, price_history: list[tuple[datetime, float]]) -> float:
+    def _score_activity(
+        self, price_history: tuple[np.ndarray, np.ndarray], now: datetime
+    ) -> float:
         """Score based on recent trading activity (0-100)."""
-        if not price_history:
+        timestamps, _ = price_history
+        if not timestamps.size:
             return 0
 
-        # Count data points in last hour vs last 24 hours
-        now = datetime.utcnow()
-        one_hour_ago = now - timedelta(hours=1)
+        # Count data points in last hour vs last 24 hours. History is ordered
+        # by timestamp, so the last-hour count is a binary search away.
+        one_hour_ago = np.datetime64(now - timedelta(hours=1), "us")
 
-        recent_count = sum(1 for ts, _ in price_history if ts >= one_hour_ago)
-        total_count = len(price_history)
+        total_count = len(timestamps)
+        recent_count = total_count - int(
+            np.searchsorted(timestamps, one_hour_ago, side="left")
+        )
 
         if total_count == 0:
             return 0
@@ -337,48 +407,92 @@ class MarketScorer:
         score = min(100, activity_ratio * 50)
         return score
 
-    async def _get_price_history(
-        self, market_id: str, hours: int = 24
-    ) -> list[tuple[datetime, float]]:
-        """Get price history for a market."""
-        since = datetime.utcnow() - timedelta(hours=hours)
-
-        result = await self.db.execute(
-            select(PriceSnapshot.timestamp, PriceSnapshot.yes_price)
-            .where(PriceSnapshot.market_id == market_id)
-            .where(PriceSnapshot.timestamp >= since)
-            .where(PriceSnapshot.yes_price.isnot(None))
-            .order_by(PriceSnapshot.timestamp)
-        )
-        rows = result.all()
-        return [(row.timestamp, row.yes_price) for row in rows]
-
-    async def _get_volume_history(
-        self, market_id: str, hours: int = 24
-    ) -> list[tuple[datetime, float]]:
-        """Get volume history for a market."""
-        since = datetime.utcnow() - timedelta(hours=hours)
-
-        result = await self.db.execute(
-            select(VolumeSnapshot.timestamp, VolumeSnapshot.volume_24h)
-            .where(VolumeSnapshot.market_id == market_id)
-            .where(VolumeSnapshot.timestamp >= since)
-            .where(VolumeSnapshot.volume_24h.isnot(None))
-            .order_by(VolumeSnapshot.timestamp)
-        )
-        rows = result.all()
-        return [(row.timestamp, row.volume_24h) for row in rows]
-
-    async def _get_previous_score(self, market_id: str) -> float | None:
-        """Get the previous score for a market."""
-        result = await self.db.execute(
-            select(MarketScore.total_score)
-            .where(MarketScore.market_id == market_id)
-            .order_by(MarketScore.timestamp.desc())
-            .limit(1)
-        )
-        row = result.scalar_one_or_none()
-        return row
+    async def _get_price_histories(
+        self, market_ids: list[str], now: datetime, hours: int = 24
+    ) -> dict[str, tuple[np.ndarray, np.ndarray]]:
+        """Get (timestamps, yes_prices) arrays for many markets, keyed by market ID."""
+        since = now - timedelta(hours=hours)
+        histories: dict[str, tuple[np.ndarray, np.ndarray]] = {}
+
+        for i in range(0, len(market_ids), self.PREFETCH_CHUNK_SIZE):
+            chunk = market_ids[i : i + self.PREFETCH_CHUNK_SIZE]
+            result = await self.db.execute(
+                select(PriceSnapshot.market_id, PriceSnapshot.timestamp, PriceSnapshot.yes_price)
+                .where(PriceSnapshot.market_id.in_(chunk))
+                .where(PriceSnapshot.timestamp >= since)
+                .where(PriceSnapshot.yes_price.isnot(None))
+                .order_by(PriceSnapshot.market_id, PriceSnapshot.timestamp)
+            )
+            histories.update(self._split_history_rows(result.all()))
+
+        return histories
+
+    async def _get_volume_histories(
+        self, market_ids: list[str], now: datetime, hours: int = 24
+    ) -> dict[str, tuple[np.ndarray, np.ndarray]]:
+        """Get (timestamps, volume_24h) arrays for many markets, keyed by market ID."""
+        since = now - timedelta(hours=hours)
+        histories: dict[str, tuple[np.ndarray, np.ndarray]] = {}
+
+        for i in range(0, len(market_ids), self.PREFETCH_CHUNK_SIZE):
+            chunk = market_ids[i : i + self.PREFETCH_CHUNK_SIZE]
+            result = await self.db.execute(
+                select(VolumeSnapshot.market_id, VolumeSnapshot.timestamp, VolumeSnapshot.volume_24h)
+                .where(VolumeSnapshot.market_id.in_(chunk))
+                .where(VolumeSnapshot.timestamp >= since)
+                .where(VolumeSnapshot.volume_24h.isnot(None))
+                .order_by(VolumeSnapshot.market_id, VolumeSnapshot.timestamp)
+            )
+            histories.update(self._split_history_rows(result.all()))
+
+        return histories
+
+    @staticmethod
+    def _split_history_rows(
+        rows: list[tuple[str, datetime, float]],
+    ) -> dict[str, tuple[np.ndarray, np.ndarray]]:
+        """Split (market_id, timestamp, value) rows ordered by market_id into arrays."""
+        if not rows:
+            return {}
+
+        market_ids, timestamps, values = zip(*rows)
+        all_timestamps = np.array(timestamps, dtype="datetime64[us]")
+        all_values = np.array(values, dtype=np.float64)
+
+        histories: dict[str, tuple[np.ndarray, np.ndarray]] = {}
+        start = 0
+        for market_id, group in groupby(market_ids):
+            end = start + sum(1 for _ in group)
+            histories[market_id] = (all_timestamps[start:end], all_values[start:end])
+            start = end
+        return histories
+
+    async def _get_previous_scores(self, market_ids: list[str]) -> dict[str, float]:
+        """Get the most recent total score for many markets, keyed by market ID."""
+        scores: dict[str, float] = {}
+
+        for i in range(0, len(market_ids), self.PREFETCH_CHUNK_SIZE):
+            chunk = market_ids[i : i + self.PREFETCH_CHUNK_SIZE]
+            latest = (
+                select(
+                    MarketScore.market_id,
+                    func.max(MarketScore.timestamp).label("latest_ts"),
+                )
+                .where(MarketScore.market_id.in_(chunk))
+                .group_by(MarketScore.market_id)
+                .subquery()
+            )
+            result = await self.db.execute(
+                select(MarketScore.market_id, MarketScore.total_score).join(
+                    latest,
+                    (MarketScore.market_id == latest.c.market_id)
+                    & (MarketScore.timestamp == latest.c.latest_ts),
+                )
+            )
+            for row in result.all():
+                scores[row.market_id] = row.total_score
+
+        return scores
 
     async def _save_score(
         self,
@@ -5,6 +5,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 
+import numpy as np
 from sqlalchemy import select, func
 
 from archantum.api.clob import PriceData
@@ -60,51 +61,54 @@ class SettlementLagDetector:
         prices: dict[str, PriceData],
     ) -> list[SettlementLagOpportunity]:
         """Find settlement lag opportunities."""
-        from archantum.db.models import PriceSnapshot
-
         opportunities = []
-        one_hour_ago = datetime.utcnow() - timedelta(hours=1)
-
         now = datetime.utcnow()
+        one_hour_ago = now - timedelta(hours=1)
         max_resolution = now + timedelta(days=self.max_days_to_resolution)
 
-        for market in markets:
-            price_data = prices.get(market.id)
-            if not price_data or price_data.yes_price is None:
-                continue
+        # YES prices for every market as one array (NaN where unknown), so the
+        # extreme-price filter, which rejects most markets, runs vectorized
+        high_threshold = self.extreme_threshold
+        get_price = prices.get
+        yes_prices = np.fromiter(
+            (
+                p.yes_price
+                if (p := get_price(market.id)) is not None and p.yes_price is not None
+                else np.nan
+                for market in markets
+            ),
+            dtype=np.float64,
+            count=len(markets),
+        )
+        # NaN compares False on both sides, so unknown prices drop out here
+        extreme_mask = (yes_prices >= high_threshold) | (yes_prices <= 1.0 - high_threshold)
+
+        # First pass: keep extreme-priced markets resolving soon
+        candidates = []
+        for idx in np.flatnonzero(extreme_mask):
+            market = markets[idx]
 
             # Skip markets without a resolution date or resolving too far out
-            if not market.end_date:
-                continue
-            try:
-                end_dt = datetime.fromisoformat(market.end_date.replace("Z", "+00:00")).replace(tzinfo=None)
-            except (ValueError, AttributeError):
-                continue
-            if end_dt > max_resolution:
+            end_dt = market.end_dt
+            if end_dt is None or end_dt > max_resolution:
                 continue
 
-            yes_price = price_data.yes_price
+            yes_price = float(yes_prices[idx])
+            candidates.append((market, yes_price, yes_price >= high_threshold, end_dt))
 
-            # Check if price is extreme (near 0 or 1)
-            is_high = yes_price >= self.extreme_threshold
-            is_low = yes_price <= (1.0 - self.extreme_threshold)
-            if not is_high and not is_low:
-                continue
+        if not candidates:
+            return opportunities
+
+        # Price from ~1 hour ago for all candidates in one query
+        try:
+            prices_1h_ago = await self._get_prices_before(
+                [market.id for market, _, _, _ in candidates], one_hour_ago
+            )
+        except Exception:
+            prices_1h_ago = {}
 
-            # Query price from ~1 hour ago
-            try:
-                async with self.db.async_session() as session:
-                    result = await session.execute(
-                        select(PriceSnapshot.yes_price)
-                        .where(PriceSnapshot.market_id == market.id)
-                        .where(PriceSnapshot.timestamp <= one_hour_ago)
-                        .order_by(PriceSnapshot.timestamp.desc())
-                        .limit(1)
-                    )
-                    row = result.scalar()
-                    price_1h_ago = float(row) if row is not None else None
-            except Exception:
-                price_1h_ago = None
+        for market, yes_price, is_high, end_dt in candidates:
+            price_1h_ago = prices_1h_ago.get(market.id)
 
             # Calculate movement
             if price_1h_ago is not None and price_1h_ago > 0:
@@ -155,3 +159,33 @@ class SettlementLagDetector:
         # Sort by potential profit descending
         opportunities.sort(key=lambda x: -x.potential_profit_cents)
         return opportunities
+
+    async def _get_prices_before(
+        self, market_ids: list[str], before: datetime
+    ) -> dict[str, float]:
+        """Get the latest yes price at or before a time for each market."""
+        from archantum.db.models import PriceSnapshot
+
+        async with self.db.async_session() as session:
+            latest = (
+                select(
+                    PriceSnapshot.market_id,
+                    func.max(PriceSnapshot.timestamp).label("latest_ts"),
+                )
+                .where(PriceSnapshot.market_id.in_(market_ids))
+                .where(PriceSnapshot.timestamp <= before)
+                .group_by(PriceSnapshot.market_id)
+                .subquery()
+            )
+            result = await session.execute(
+                select(PriceSnapshot.market_id, PriceSnapshot.yes_price).join(
+                    latest,
+                    (PriceSnapshot.market_id == latest.c.market_id)
+                    & (PriceSnapshot.timestamp == latest.c.latest_ts),
+                )
+            )
+            return {
+                row.market_id: float(row.yes_price)
+                for row in result.all()
+                if row.yes_price is not None
+            }
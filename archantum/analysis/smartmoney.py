@@ -2,12 +2,20 @@
 
 from __future__ import annotations
 
+import asyncio
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Any
 
+from rich.console import Console
+
 from archantum.db import Database
+from archantum.db.models import SmartWallet
 from archantum.api.data import DataAPIClient, LeaderboardEntry, TradeActivity
+from archantum.analysis.wallet_strategy import infer_category
+
+
+console = Console()
 
 
 @dataclass
@@ -57,6 +65,9 @@ class SmartMoneyAlert:
 class SmartMoneyTracker:
     """Tracks and analyzes smart money wallets."""
 
+    # Max wallets synced concurrently by sync_all_tracked_wallets
+    MAX_CONCURRENT_WALLET_SYNCS = 8
+
     def __init__(
         self,
         db: Database,
@@ -94,9 +105,15 @@ class SmartMoneyTracker:
 
             return count
 
-    async def fetch_wallet_trades(self, wallet_address: str, limit: int = 50) -> int:
+    async def fetch_wallet_trades(
+        self,
+        wallet_address: str,
+        limit: int = 50,
+        client: DataAPIClient | None = None,
+    ) -> int:
         """Fetch recent trades for a wallet.
 
+        Pass an open client to reuse its connections across wallets.
         Returns number of new trades saved.
         """
         # Get wallet from DB
@@ -104,47 +121,73 @@ class SmartMoneyTracker:
         if not wallet:
             return 0
 
-        async with DataAPIClient() as client:
-            trades = await client.get_wallet_activity(
-                wallet=wallet_address,
-                limit=limit,
-                activity_type="TRADE",
-            )
-
-            count = 0
-            for trade in trades:
-                result = await self.db.save_smart_trade(
-                    wallet_id=wallet.id,
-                    transaction_hash=trade.transaction_hash,
-                    condition_id=trade.condition_id,
-                    market_title=trade.title,
-                    event_slug=trade.event_slug,
-                    side=trade.side,
-                    outcome=trade.outcome,
-                    size=trade.size,
-                    usdc_size=trade.usdc_size,
-                    price=trade.price,
-                    timestamp=datetime.fromtimestamp(trade.timestamp),
-                )
-                if result:  # New trade saved
-                    count += 1
-
-            return count
+        if client is None:
+            async with DataAPIClient() as client:
+                return await self._save_wallet_trades(client, wallet, limit)
+        return await self._save_wallet_trades(client, wallet, limit)
+
+    async def _save_wallet_trades(
+        self, client: DataAPIClient, wallet: SmartWallet, limit: int
+    ) -> int:
+        """Fetch a wallet's recent trades and save new ones."""
+        trades = await client.get_wallet_activity(
+            wallet=wallet.wallet_address,
+            limit=limit,
+            activity_type="TRADE",
+        )
+
+        trades_data = [
+            {
+                "transaction_hash": trade.transaction_hash,
+                "condition_id": trade.condition_id,
+                "market_title": trade.title,
+                "category": infer_category(trade.title or ""),
+                "event_slug": trade.event_slug,
+                "side": trade.side,
+                "outcome": trade.outcome,
+                "size": trade.size,
+                "usdc_size": trade.usdc_size,
+                "price": trade.price,
+                "timestamp": datetime.fromtimestamp(trade.timestamp),
+            }
+            for trade in trades
+        ]
+
+        # Single batched insert; returns the number of new trades saved
+        return await self.db.save_smart_trades_batch(wallet.id, trades_data)
 
     async def sync_all_tracked_wallets(self) -> dict[str, int]:
         """Sync trades for all tracked wallets.
 
+        Wallets are synced concurrently (bounded) over one shared client.
         Returns dict of wallet -> new trades count.
         """
         wallets = await self.db.get_tracked_wallets()
-        results = {}
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_WALLET_SYNCS)
+
+        async with DataAPIClient() as client:
 
-        for wallet in wallets:
-            count = await self.fetch_wallet_trades(wallet.wallet_address)
-            if count > 0:
-                results[wallet.wallet_address] = count
+            async def sync(wallet: SmartWallet) -> int:
+                # A failing wallet counts as zero new trades; it must not
+                # abort the gather while the others still use the client
+                async with semaphore:
+                    try:
+                        return await self.fetch_wallet_trades(
+                            wallet.wallet_address, client=client
+                        )
+                    except Exception as e:
+                        console.print(
+                            f"[yellow]Failed to sync wallet {wallet.wallet_address[:10]}: {e}[/yellow]"
+                        )
+                        return 0
+
+            counts = await asyncio.gather(*(sync(wallet) for wallet in wallets))
 
-        return results
+        return {
+            wallet.wallet_address: count
+            for wallet, count in zip(wallets, counts)
+            if count > 0
+        }
 
     async def get_pending_alerts(self) -> list[SmartMoneyAlert]:
         """Get trades that should be alerted."""
@@ -166,8 +209,8 @@ class SmartMoneyTracker:
             )
             alerts.append(alert)
 
-            # Mark as alerted
-            await self.db.mark_trade_alerted(trade.id)
+        # Mark all as alerted in one UPDATE
+        await self.db.mark_trades_alerted([trade.id for trade, _ in unsent])
 
         return alerts
 
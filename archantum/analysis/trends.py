@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
+import asyncio
 from dataclasses import dataclass
-from datetime import datetime, timedelta
 from archantum.db import Database
+from archantum.db.models import PriceSnapshot
 from archantum.api.gamma import GammaMarket
 
 
@@ -42,15 +43,29 @@ class TrendSignal:
 class TrendAnalyzer:
     """Analyzes markets for trends using moving averages."""
 
+    # Moving average windows (hours)
+    MA_WINDOWS_HOURS = [1, 4, 24]
+
     def __init__(self, db: Database):
         self.db = db
 
     async def analyze(self, markets: list[GammaMarket]) -> list[TrendSignal]:
         """Analyze trends across markets."""
-        signals = []
+        # Latest prices and all moving averages for every market in two
+        # groupwise queries, so the loop below does no DB calls
+        market_ids = [m.id for m in markets]
+        latest_snapshots, moving_averages = await asyncio.gather(
+            self.db.get_latest_price_snapshots(market_ids),
+            self.db.get_price_moving_averages(market_ids, self.MA_WINDOWS_HOURS),
+        )
 
+        signals = []
         for market in markets:
-            signal = await self.check_market(market)
+            signal = self._build_signal(
+                market,
+                latest_snapshots.get(market.id),
+                moving_averages.get(market.id),
+            )
             if signal and signal.signal != "neutral":
                 signals.append(signal)
 
@@ -60,17 +75,24 @@ class TrendAnalyzer:
 
     async def check_market(self, market: GammaMarket) -> TrendSignal | None:
         """Check a single market for trend signals."""
-        # Get latest price
-        latest = await self.db.get_latest_price_snapshot(market.id)
+        latest, moving_averages = await asyncio.gather(
+            self.db.get_latest_price_snapshot(market.id),
+            self.db.get_price_moving_averages([market.id], self.MA_WINDOWS_HOURS),
+        )
+        return self._build_signal(market, latest, moving_averages.get(market.id))
+
+    def _build_signal(
+        self,
+        market: GammaMarket,
+        latest: PriceSnapshot | None,
+        moving_averages: list[float | None] | None,
+    ) -> TrendSignal | None:
+        """Build a trend signal from a market's latest snapshot and MAs."""
         if not latest or latest.yes_price is None:
             return None
 
         current_price = latest.yes_price
-
-        # Calculate moving averages
-        ma_1h = await self._calculate_ma(market.id, hours=1)
-        ma_4h = await self._calculate_ma(market.id, hours=4)
-        ma_24h = await self._calculate_ma(market.id, hours=24)
+        ma_1h, ma_4h, ma_24h = moving_averages or [None, None, None]
 
         # Determine signal
         signal, momentum = self._determine_signal(current_price, ma_1h, ma_4h, ma_24h)
@@ -88,20 +110,6 @@ class TrendAnalyzer:
             momentum=momentum,
         )
 
-    async def _calculate_ma(self, market_id: str, hours: int) -> float | None:
-        """Calculate moving average for a given time period."""
-        since = datetime.utcnow() - timedelta(hours=hours)
-        snapshots = await self.db.get_price_snapshots(market_id, since=since, limit=1000)
-
-        if not snapshots:
-            return None
-
-        prices = [s.yes_price for s in snapshots if s.yes_price is not None]
-        if not prices:
-            return None
-
-        return sum(prices) / len(prices)
-
     def _determine_signal(
         self,
         current: float,
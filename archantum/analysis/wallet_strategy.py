@@ -2,13 +2,16 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
-import statistics
+import re
 from collections import defaultdict
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from datetime import datetime, timedelta
+from functools import cached_property, lru_cache
 from typing import Any
 
+import numpy as np
 from rich.console import Console
 
 from archantum.db.database import Database
@@ -17,6 +20,9 @@ from archantum.api.data import DataAPIClient
 
 console = Console()
 
+# Compact separators for the JSON blobs stored on WalletAnalysis
+_JSON_SEPARATORS = (",", ":")
+
 
 # ---------------------------------------------------------------------------
 # Category inference
@@ -65,39 +71,74 @@ CATEGORY_KEYWORDS: dict[str, list[str]] = {
 }
 
 
+# One compiled alternation per category, checked in CATEGORY_KEYWORDS order so
+# the first matching category still wins (a single global regex would return
+# whichever keyword appears leftmost in the title instead)
+_CATEGORY_PATTERNS: list[tuple[str, re.Pattern[str]]] = [
+    (
+        category,
+        re.compile("|".join(re.escape(kw) for kw in sorted(keywords, key=len, reverse=True))),
+    )
+    for category, keywords in CATEGORY_KEYWORDS.items()
+]
+
+
+@lru_cache(maxsize=4096)  # many positions share a market title
 def infer_category(title: str) -> str:
     """Infer market category from title keywords."""
     title_lower = title.lower()
-    for category, keywords in CATEGORY_KEYWORDS.items():
-        for kw in keywords:
-            if kw in title_lower:
-                return category
+    for category, pattern in _CATEGORY_PATTERNS:
+        if pattern.search(title_lower):
+            return category
     return "other"
 
 
+def _utc_datetimes(timestamps: list[int]) -> list[datetime]:
+    """Convert unix timestamps to naive UTC datetimes in one numpy pass."""
+    return np.asarray(timestamps, dtype=np.int64).astype("datetime64[s]").tolist()
+
+
+def _max_drawdown_pct(pnls: np.ndarray) -> float:
+    """Max drawdown of the cumulative P&L curve, as % of its final peak.
+
+    The running peak starts at 0 (flat before the first trade).
+    """
+    cumulative = np.cumsum(pnls)
+    peaks = np.maximum.accumulate(np.maximum(cumulative, 0.0))
+    max_dd = float((peaks - cumulative).max())
+    peak = float(peaks[-1])
+    return (max_dd / peak * 100) if peak > 0 else 0.0
+
+
 # ---------------------------------------------------------------------------
 # Position state — groups trades by (condition_id, outcome)
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(eq=False)  # compared by identity; skips the generated field-wise __eq__
 class PositionState:
     """Tracks accumulated state for a single position."""
 
     condition_id: str
     outcome: str
     market_title: str = ""
+    category: str | None = None
     total_bought: float = 0.0
     total_buy_cost: float = 0.0
     total_sold: float = 0.0
     total_sell_proceeds: float = 0.0
-    buy_prices: list[float] = field(default_factory=list)
-    sell_prices: list[float] = field(default_factory=list)
+    buy_count: int = 0
+    sell_count: int = 0
+    max_sell_price: float = 0.0
     first_buy_at: datetime | None = None
     last_action_at: datetime | None = None
 
     settled_as_loss: bool = False
 
-    @property
+    # The derived values below are read by several analysis modules and are
+    # cached on first access; _build_positions finishes mutating a position
+    # (including settled_as_loss) before anything reads them.
+
+    @cached_property
     def is_closed(self) -> bool:
         """Position is closed if >= 95% of shares sold or settled as loss."""
         if self.total_bought == 0:
@@ -106,7 +147,7 @@ class PositionState:
             return True
         return self.total_sold >= self.total_bought * 0.95
 
-    @property
+    @cached_property
     def realized_pnl(self) -> float:
         """Realized P&L for closed positions."""
         if self.total_bought == 0:
@@ -119,7 +160,7 @@ class PositionState:
         sold_shares = min(self.total_sold, self.total_bought)
         return (self.total_sell_proceeds - (sold_shares * avg_buy)) if sold_shares > 0 else 0.0
 
-    @property
+    @cached_property
     def is_winner(self) -> bool:
         return self.realized_pnl > 0
 
@@ -184,13 +225,7 @@ class WalletStrategyResult:
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dict for DB storage."""
-        d: dict[str, Any] = {}
-        for k, v in self.__dict__.items():
-            if isinstance(v, datetime):
-                d[k] = v
-            else:
-                d[k] = v
-        return d
+        return dict(self.__dict__)
 
 
 # ---------------------------------------------------------------------------
@@ -232,9 +267,11 @@ class WalletStrategyAnalyzer:
         total_fetched = 0
 
         async with DataAPIClient() as client:
-            # Phase 1: Fetch TRADE activities
+            # Phase 1: Fetch TRADE activities. Each page's DB save runs in the
+            # background while the next page is fetched; saves stay in order.
             offset = 0
             page_size = 500
+            save_task: asyncio.Task[int] | None = None
             for page_num in range(1, max_pages + 1):
                 try:
                     activities = await client.get_wallet_activity(
@@ -260,30 +297,39 @@ class WalletStrategyAnalyzer:
                         pass
 
                 trades_data = []
-                for act in activities:
+                timestamps = _utc_datetimes([act.timestamp for act in activities])
+                for act, timestamp in zip(activities, timestamps):
                     try:
                         trades_data.append({
                             "transaction_hash": act.transaction_hash,
                             "condition_id": act.condition_id,
                             "market_title": act.title or "",
+                            "category": infer_category(act.title or ""),
                             "event_slug": act.event_slug,
                             "side": act.side,
                             "outcome": act.outcome or f"outcome_{act.outcome_index}",
                             "size": act.size,
                             "usdc_size": act.usdc_size,
                             "price": act.price,
-                            "timestamp": datetime.utcfromtimestamp(act.timestamp),
+                            "timestamp": timestamp,
                         })
                     except Exception:
                         pass
 
-                page_new = await self.db.save_smart_trades_batch(wallet.id, trades_data)
-                new_count += page_new
+                if save_task is not None:
+                    new_count += await save_task
+                save_task = asyncio.create_task(
+                    self.db.save_smart_trades_batch(wallet.id, trades_data)
+                )
 
                 if len(activities) < page_size:
                     break
                 offset += page_size
 
+            if save_task is not None:
+                new_count += await save_task
+                save_task = None
+
             # Phase 2: Fetch REDEEM activities (settlement wins)
             # First build a map of condition_id → outcome from buy trades
             all_trades = await self.db.get_all_wallet_trades(wallet_address)
@@ -340,7 +386,8 @@ class WalletStrategyAnalyzer:
                     break
 
                 redeem_data = []
-                for act in redeems:
+                timestamps = _utc_datetimes([act.timestamp for act in redeems])
+                for act, timestamp in zip(redeems, timestamps):
                     try:
                         cid = act.condition_id
                         outcome = buy_outcome_map.get(cid, f"outcome_{act.outcome_index}")
@@ -352,30 +399,38 @@ class WalletStrategyAnalyzer:
                         # Losing side:  size = 0, saved as marker (size=0,
                         #               usdc=0, price=1.0) so _build_positions
                         #               can detect the settlement loss.
+                        title = act.title or buy_title_map.get(cid, "")
                         redeem_data.append({
                             "transaction_hash": f"{act.transaction_hash}_redeem_{cid}",
                             "condition_id": cid,
-                            "market_title": act.title or buy_title_map.get(cid, ""),
+                            "market_title": title,
+                            "category": infer_category(title),
                             "event_slug": act.event_slug or buy_slug_map.get(cid),
                             "side": "SELL",
                             "outcome": outcome,
                             "size": act.size,
                             "usdc_size": act.size,  # $1.00 per share (0 for losses)
                             "price": 1.0,
-                            "timestamp": datetime.utcfromtimestamp(act.timestamp),
+                            "timestamp": timestamp,
                         })
                         if act.size > 0:
                             redeem_count += 1
                     except Exception:
                         pass
 
-                page_new = await self.db.save_smart_trades_batch(wallet.id, redeem_data)
-                new_count += page_new
+                if save_task is not None:
+                    new_count += await save_task
+                save_task = asyncio.create_task(
+                    self.db.save_smart_trades_batch(wallet.id, redeem_data)
+                )
 
                 if len(redeems) < page_size:
                     break
                 offset += page_size
 
+            if save_task is not None:
+                new_count += await save_task
+
             if redeem_count > 0:
                 console.print(f"[green]Fetched {redeem_count} redemptions (settlement wins)[/green]")
 
@@ -388,13 +443,14 @@ class WalletStrategyAnalyzer:
             return None
 
         positions = self._build_positions(trades)
+        arrays = self._vectorize_trades(trades)
         result = WalletStrategyResult()
 
-        self._compute_basic_stats(result, trades, positions)
-        self._compute_entry_analysis(result, trades, positions)
+        self._compute_basic_stats(result, arrays, positions)
+        self._compute_entry_analysis(result, arrays, positions)
         self._compute_exit_analysis(result, positions)
         self._compute_category_analysis(result, trades, positions)
-        self._compute_pattern_detection(result, trades)
+        self._compute_pattern_detection(result, trades, arrays)
         self._compute_risk_analysis(result, trades, positions)
 
         result.trades_analyzed = len(trades)
@@ -443,26 +499,31 @@ class WalletStrategyAnalyzer:
         """
         pos_map: dict[tuple[str, str], PositionState] = {}
 
+        # Running scalar accumulators only: nothing per position grows with
+        # its trade count
         for t in trades:
             key = (t.condition_id, t.outcome)
-            if key not in pos_map:
-                pos_map[key] = PositionState(
+            pos = pos_map.get(key)
+            if pos is None:
+                pos = pos_map[key] = PositionState(
                     condition_id=t.condition_id,
                     outcome=t.outcome,
                     market_title=t.market_title,
+                    category=t.category,
                 )
-            pos = pos_map[key]
 
             if t.side == "BUY":
                 pos.total_bought += t.size
                 pos.total_buy_cost += t.usdc_size
-                pos.buy_prices.append(t.price)
+                pos.buy_count += 1
                 if pos.first_buy_at is None:
                     pos.first_buy_at = t.timestamp
             elif t.side == "SELL":
                 pos.total_sold += t.size
                 pos.total_sell_proceeds += t.usdc_size
-                pos.sell_prices.append(t.price)
+                pos.sell_count += 1
+                if t.price > pos.max_sell_price:
+                    pos.max_sell_price = t.price
 
             pos.last_action_at = t.timestamp
 
@@ -474,7 +535,7 @@ class WalletStrategyAnalyzer:
         # Any OTHER outcome on the same condition_id is a loss.
         redeemed_conditions: dict[str, str] = {}  # condition_id → winning outcome
         for pos in pos_map.values():
-            if pos.total_sold > 0 and any(p >= 0.99 for p in pos.sell_prices):
+            if pos.total_sold > 0 and pos.max_sell_price >= 0.99:
                 redeemed_conditions[pos.condition_id] = pos.outcome
 
         # Step 2: Mark settlement losses.
@@ -490,9 +551,9 @@ class WalletStrategyAnalyzer:
 
             # Check 1: Zero-value REDEEM marker — the API returned a
             # REDEEM with size=0 for this position, meaning shares
-            # expired worthless.  Detected by: sell_prices contains 1.0
+            # expired worthless.  Detected by: a sell at 1.0 was recorded
             # but total_sold is 0.
-            if pos.total_sold == 0 and any(p >= 0.99 for p in pos.sell_prices):
+            if pos.total_sold == 0 and pos.max_sell_price >= 0.99:
                 pos.settled_as_loss = True
                 continue
 
@@ -511,6 +572,24 @@ class WalletStrategyAnalyzer:
 
         return list(pos_map.values())
 
+    @staticmethod
+    def _vectorize_trades(trades: list[SmartTrade]) -> dict[str, np.ndarray]:
+        """Convert trades into per-field arrays (one pass per field, in C).
+
+        The analysis modules below aggregate over these instead of
+        re-walking the trade objects for every statistic.
+        """
+        n = len(trades)
+        sides = [t.side for t in trades]
+        return {
+            "price": np.fromiter((t.price for t in trades), dtype=np.float64, count=n),
+            "usdc_size": np.fromiter((t.usdc_size for t in trades), dtype=np.float64, count=n),
+            "is_buy": np.fromiter((s == "BUY" for s in sides), dtype=bool, count=n),
+            "is_sell": np.fromiter((s == "SELL" for s in sides), dtype=bool, count=n),
+            "is_yes": np.fromiter((t.outcome.lower() == "yes" for t in trades), dtype=bool, count=n),
+            "hour": np.fromiter((t.timestamp.hour for t in trades), dtype=np.int64, count=n),
+        }
+
     # ------------------------------------------------------------------
     # Analysis modules
     # ------------------------------------------------------------------
@@ -518,27 +597,28 @@ class WalletStrategyAnalyzer:
     @staticmethod
     def _compute_basic_stats(
         result: WalletStrategyResult,
-        trades: list[SmartTrade],
+        arrays: dict[str, np.ndarray],
         positions: list[PositionState],
     ) -> None:
-        buys = [t for t in trades if t.side == "BUY"]
-        sells = [t for t in trades if t.side == "SELL"]
-        result.total_trades = len(trades)
-        result.total_buys = len(buys)
-        result.total_sells = len(sells)
-        result.total_usdc_volume = sum(t.usdc_size for t in trades)
+        usdc = arrays["usdc_size"]
+        is_buy = arrays["is_buy"]
+        is_sell = arrays["is_sell"]
+        result.total_trades = len(usdc)
+        result.total_buys = int(is_buy.sum())
+        result.total_sells = int(is_sell.sum())
+        result.total_usdc_volume = float(usdc.sum())
 
         closed = [p for p in positions if p.is_closed]
         result.win_count = sum(1 for p in closed if p.is_winner)
         result.loss_count = len(closed) - result.win_count
-        result.open_positions = sum(1 for p in positions if not p.is_closed)
+        result.open_positions = len(positions) - len(closed)
         result.win_rate = (result.win_count / len(closed) * 100) if closed else 0.0
 
         # PnL: use (total proceeds − total cost) across all trades.
         # This matches Polymarket's official PnL methodology and avoids
         # compounding settlement-detection heuristic errors.
-        total_sell_proceeds = sum(t.usdc_size for t in trades if t.side == "SELL")
-        total_buy_costs = sum(t.usdc_size for t in trades if t.side == "BUY")
+        total_sell_proceeds = float(usdc[is_sell].sum())
+        total_buy_costs = float(usdc[is_buy].sum())
         result.realized_pnl = total_sell_proceeds - total_buy_costs
 
         result.roi_pct = (result.realized_pnl / total_buy_costs * 100) if total_buy_costs > 0 else 0.0
@@ -546,24 +626,28 @@ class WalletStrategyAnalyzer:
     @staticmethod
     def _compute_entry_analysis(
         result: WalletStrategyResult,
-        trades: list[SmartTrade],
+        arrays: dict[str, np.ndarray],
         positions: list[PositionState],
     ) -> None:
-        buy_trades = [t for t in trades if t.side == "BUY"]
-        if not buy_trades:
+        is_buy = arrays["is_buy"]
+        buy_count = int(is_buy.sum())
+        if not buy_count:
             return
 
-        prices = [t.price for t in buy_trades]
-        result.avg_entry_price = statistics.mean(prices)
-        result.median_entry_price = statistics.median(prices)
+        prices = arrays["price"][is_buy]
+        result.avg_entry_price = float(prices.mean())
+        result.median_entry_price = float(np.median(prices))
 
-        yes_buys = sum(1 for t in buy_trades if t.outcome.lower() == "yes")
-        result.yes_preference_pct = (yes_buys / len(buy_trades) * 100) if buy_trades else 0.0
+        yes_buys = int(arrays["is_yes"][is_buy].sum())
+        result.yes_preference_pct = yes_buys / buy_count * 100
 
-        position_sizes = [p.total_buy_cost for p in positions if p.total_buy_cost > 0]
-        if position_sizes:
-            result.avg_position_usdc = statistics.mean(position_sizes)
-            result.median_position_usdc = statistics.median(position_sizes)
+        position_sizes = np.fromiter(
+            (p.total_buy_cost for p in positions), dtype=np.float64, count=len(positions)
+        )
+        position_sizes = position_sizes[position_sizes > 0]
+        if position_sizes.size:
+            result.avg_position_usdc = float(position_sizes.mean())
+            result.median_position_usdc = float(np.median(position_sizes))
 
     @staticmethod
     def _compute_exit_analysis(
@@ -580,8 +664,7 @@ class WalletStrategyAnalyzer:
         hold_hours_list: list[float] = []
 
         for p in closed:
-            max_sell = max(p.sell_prices) if p.sell_prices else 0
-            if max_sell > 0.95:
+            if p.max_sell_price > 0.95:
                 settlement_count += 1
             else:
                 early_exit_count += 1
@@ -592,7 +675,7 @@ class WalletStrategyAnalyzer:
 
         result.hold_to_settlement_pct = (settlement_count / len(closed) * 100)
         result.early_exit_pct = (early_exit_count / len(closed) * 100)
-        result.avg_hold_hours = statistics.mean(hold_hours_list) if hold_hours_list else None
+        result.avg_hold_hours = float(np.mean(hold_hours_list)) if hold_hours_list else None
 
     @staticmethod
     def _compute_category_analysis(
@@ -606,8 +689,10 @@ class WalletStrategyAnalyzer:
         )
 
         for p in positions:
-            cat = infer_category(p.market_title)
-            cat_data[cat]["trades"] += len(p.buy_prices) + len(p.sell_prices)
+            # Category is stored at ingest; rows saved before that fall back
+            # to inferring it from the title
+            cat = p.category or infer_category(p.market_title)
+            cat_data[cat]["trades"] += p.buy_count + p.sell_count
             cat_data[cat]["volume"] += p.total_buy_cost + p.total_sell_proceeds
             if p.is_closed:
                 if p.is_winner:
@@ -624,24 +709,29 @@ class WalletStrategyAnalyzer:
 
         # Sort by volume descending
         breakdown = dict(sorted(breakdown.items(), key=lambda x: x[1]["volume"], reverse=True))
-        result.category_breakdown = json.dumps(breakdown)
+        result.category_breakdown = json.dumps(breakdown, separators=_JSON_SEPARATORS)
 
     @staticmethod
     def _compute_pattern_detection(
         result: WalletStrategyResult,
         trades: list[SmartTrade],
+        arrays: dict[str, np.ndarray],
     ) -> None:
         if not trades:
             return
 
-        # Hour distribution
-        hour_counts: dict[int, int] = defaultdict(int)
-        for t in trades:
-            hour_counts[t.timestamp.hour] += 1
-
-        # Top 5 most active hours
-        sorted_hours = sorted(hour_counts.items(), key=lambda x: x[1], reverse=True)[:5]
-        result.most_active_hours = json.dumps([{"hour": h, "count": c} for h, c in sorted_hours])
+        # Hour distribution: O(N) histogram plus each hour's first-seen index
+        hours = arrays["hour"]
+        counts = np.bincount(hours, minlength=24)
+        first_seen = np.full(24, len(hours))
+        np.minimum.at(first_seen, hours, np.arange(len(hours)))
+
+        # Top 5 most active hours (ties keep first-seen order)
+        top = [h for h in np.lexsort((first_seen, -counts))[:5] if counts[h]]
+        result.most_active_hours = json.dumps(
+            [{"hour": int(h), "count": int(counts[h])} for h in top],
+            separators=_JSON_SEPARATORS,
+        )
 
         # Trades per day
         if len(trades) >= 2:
@@ -653,13 +743,12 @@ class WalletStrategyAnalyzer:
             result.avg_trades_per_day = 0.0
 
         # Contrarian score: buys at < 0.30, sells at > 0.70
-        buy_trades = [t for t in trades if t.side == "BUY"]
-        sell_trades = [t for t in trades if t.side == "SELL"]
+        price = arrays["price"]
+        is_buy = arrays["is_buy"]
+        is_sell = arrays["is_sell"]
 
-        contrarian_buys = sum(1 for t in buy_trades if t.price < 0.30) if buy_trades else 0
-        contrarian_sells = sum(1 for t in sell_trades if t.price > 0.70) if sell_trades else 0
-        total_contrarian = contrarian_buys + contrarian_sells
-        total_relevant = len(buy_trades) + len(sell_trades)
+        total_contrarian = int(((is_buy & (price < 0.30)) | (is_sell & (price > 0.70))).sum())
+        total_relevant = int(is_buy.sum() + is_sell.sum())
         result.contrarian_score = (total_contrarian / total_relevant * 100) if total_relevant > 0 else 0.0
 
     @staticmethod
@@ -671,19 +760,23 @@ class WalletStrategyAnalyzer:
         if not positions:
             return
 
+        # Position sizes gathered once for max, total and HHI
+        position_sizes = np.fromiter(
+            (p.total_buy_cost for p in positions), dtype=np.float64, count=len(positions)
+        )
+
         # Max single position
-        position_sizes = [p.total_buy_cost for p in positions]
-        result.max_position_usdc = max(position_sizes) if position_sizes else 0.0
+        result.max_position_usdc = float(position_sizes.max())
 
         # Unique markets
         unique_conditions = {p.condition_id for p in positions}
         result.unique_markets_traded = len(unique_conditions)
 
         # Diversification score (1 - HHI)
-        total_vol = sum(p.total_buy_cost for p in positions)
+        total_vol = float(position_sizes.sum())
         if total_vol > 0:
-            shares = [(p.total_buy_cost / total_vol) for p in positions if p.total_buy_cost > 0]
-            hhi = sum(s ** 2 for s in shares)
+            shares = position_sizes[position_sizes > 0] / total_vol
+            hhi = float(np.dot(shares, shares))
             result.diversification_score = round((1 - hhi) * 100, 1)
         else:
             result.diversification_score = 0.0
@@ -691,20 +784,15 @@ class WalletStrategyAnalyzer:
         # Max drawdown from cumulative P&L curve
         closed = [p for p in positions if p.is_closed]
         if closed:
-            # Sort closed positions by last_action_at
-            closed_sorted = sorted(closed, key=lambda p: p.last_action_at or datetime.min)
-            cumulative = 0.0
-            peak = 0.0
-            max_dd = 0.0
-
-            for p in closed_sorted:
-                cumulative += p.realized_pnl
-                if cumulative > peak:
-                    peak = cumulative
-                dd = peak - cumulative
-                if dd > max_dd:
-                    max_dd = dd
-
-            result.max_drawdown_pct = (max_dd / peak * 100) if peak > 0 else 0.0
+            # Order closed positions' P&L by last_action_at (stable, as sorted() was)
+            last_actions = np.array(
+                [p.last_action_at or datetime.min for p in closed], dtype="datetime64[us]"
+            )
+            pnls = np.fromiter(
+                (p.realized_pnl for p in closed), dtype=np.float64, count=len(closed)
+            )
+            result.max_drawdown_pct = _max_drawdown_pct(
+                pnls[np.argsort(last_actions, kind="stable")]
+            )
         else:
             result.max_drawdown_pct = 0.0
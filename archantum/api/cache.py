@@ -0,0 +1,74 @@
+"""Small in-process TTL cache for API responses."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Hashable
+
+
+class TTLCache:
+    """Time-to-live cache keyed by request parameters.
+
+    Entries older than `ttl` seconds (time.monotonic) read as misses. Once
+    the cache holds `max_entries` keys, expired ones are swept on insert.
+    """
+
+    def __init__(self, ttl: float, max_entries: int = 256):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: dict[Hashable, tuple[float, Any]] = {}
+        # key -> [lock, callers holding or waiting on it]; an entry lives
+        # until its last caller leaves, so every miss on a key queues on
+        # the same lock
+        self._locks: dict[Hashable, list] = {}
+
+    def get(self, key: Hashable) -> Any | None:
+        """Return the cached value for `key`, or None if missing or expired."""
+        hit = self._entries.get(key)
+        if hit is None:
+            return None
+        if time.monotonic() - hit[0] >= self.ttl:
+            del self._entries[key]
+            return None
+        return hit[1]
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store `value` under `key`."""
+        now = time.monotonic()
+        if len(self._entries) >= self.max_entries:
+            for stale in [k for k, (at, _) in self._entries.items() if now - at >= self.ttl]:
+                del self._entries[stale]
+        self._entries[key] = (now, value)
+
+    async def get_or_fetch(self, key: Hashable, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        """Return the cached value for `key`, otherwise fetch and store it.
+
+        Concurrent misses on one key share a single fetch. A fetch result of
+        None is returned but not cached.
+        """
+        value = self.get(key)
+        if value is not None:
+            return value
+
+        entry = self._locks.get(key)
+        if entry is None:
+            entry = self._locks[key] = [asyncio.Lock(), 0]
+        entry[1] += 1
+        try:
+            async with entry[0]:
+                # An earlier holder of the lock may have filled it
+                value = self.get(key)
+                if value is None:
+                    value = await fetch()
+                    if value is not None:
+                        self.set(key, value)
+                return value
+        finally:
+            entry[1] -= 1
+            if entry[1] == 0:
+                del self._locks[key]
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        self._entries.clear()
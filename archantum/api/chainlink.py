@@ -2,10 +2,15 @@
 
 from __future__ import annotations
 
+import asyncio
 import time
+from collections import OrderedDict, deque
+from typing import Any, Awaitable, Callable, TypeVar
 
 import httpx
 
+from archantum.api.http import HTTP_LIMITS, JSON_HEADERS, http_timeout, json_body, parse_json
+
 # Chainlink BTC/USD Price Feed contracts
 # Polygon mainnet (used by Polymarket for resolution) - updates faster
 CHAINLINK_BTC_USD_POLYGON = "0xc907E116054Ad103354f2D350FD2514433D57F6f"
@@ -16,6 +21,63 @@ CHAINLINK_BTC_USD_ETH = "0xF4030086522a5bEEa4988F8cA5B36dbC97BeE88c"
 LATEST_ROUND_DATA_SELECTOR = "0xfeaf968c"
 
 
+def _eth_call_payload(contract: str, block: str, request_id: int = 1) -> dict:
+    """JSON-RPC eth_call of latestRoundData() on `contract` at `block`."""
+    return {
+        "jsonrpc": "2.0",
+        "method": "eth_call",
+        "params": [{"to": contract, "data": LATEST_ROUND_DATA_SELECTOR}, block],
+        "id": request_id,
+    }
+
+
+# Serialized once at import: the latest-price poll for each feed and the
+# latest-block lookup never vary, so the hot path posts these bytes as-is
+LATEST_ROUND_DATA_BODIES = {
+    contract: json_body(_eth_call_payload(contract, "latest"))
+    for contract in (CHAINLINK_BTC_USD_POLYGON, CHAINLINK_BTC_USD_ETH)
+}
+LATEST_BLOCK_BODY = json_body({
+    "jsonrpc": "2.0",
+    "method": "eth_getBlockByNumber",
+    "params": ["latest", False],
+    "id": 1,
+})
+
+T = TypeVar("T")
+
+
+def _hex_quantity(value: str) -> int:
+    """Decode a JSON-RPC hex QUANTITY ("0x1b4") to int.
+
+    int(value, 16) beats bytes.fromhex + int.from_bytes at every length an
+    RPC quantity takes, so this stays a thin wrapper.
+    """
+    return int(value, 16)
+
+
+_RESULT_MARKER = b'"result":"0x'
+_ZERO_WORD = bytes(32)
+
+
+def _result_hex(content: bytes) -> str | None:
+    """Hex payload (without 0x) of a compact JSON-RPC success reply, if present."""
+    start = content.find(_RESULT_MARKER)
+    if start < 0:
+        return None
+    start += len(_RESULT_MARKER)
+    end = content.find(b'"', start)
+    if end <= start:
+        return None
+    return content[start:end].decode("ascii")
+
+
+def _is_fresh(result: tuple[float | None, int | None], cutoff: int) -> bool:
+    """Whether a (price, updated_at) answer is present and newer than `cutoff`."""
+    price, updated_at = result
+    return bool(price and updated_at and updated_at > cutoff)
+
+
 class ChainlinkClient:
     """Client for Chainlink BTC/USD price feed via public RPC.
 
@@ -39,17 +101,48 @@ class ChainlinkClient:
         "https://1rpc.io/eth",
     ]
 
-    def __init__(self):
-        self._client: httpx.AsyncClient | None = None
-        self._polygon_rpc_index = 0
-        self._eth_rpc_index = 0
+    # Wall-clock budget for racing all endpoints of one chain (seconds)
+    RPC_RACE_TIMEOUT = 5.0
+    # Historical lookups make three sequential RPCs per endpoint
+    HISTORICAL_RACE_TIMEOUT = 15.0
+    # Head start each endpoint gets before the next one is fired (seconds)
+    RPC_HEDGE_DELAY = 0.15
+    # Block-by-timestamp search: stop within this many seconds of the
+    # target, giving up after this many probes
+    BLOCK_SEARCH_TOLERANCE = 3
+    BLOCK_SEARCH_MAX_PROBES = 5
+    # Plausible BTC/USD band; answers outside it are treated as bad data
+    MIN_SANE_PRICE = 10_000.0
+    MAX_SANE_PRICE = 1_000_000.0
+    # Historical prices never change; keep this many recent lookups
+    HISTORICAL_CACHE_SIZE = 256
+
+    # Shared by all instances: callers open a short-lived client per lookup.
+    # (price, fetched_at monotonic) of the last successful latest-price fetch
+    _price_cache: tuple[float, float] | None = None
+    _historical_cache: OrderedDict[int, float] = OrderedDict()
+    # target timestamp -> Polygon block found for it
+    _block_cache: dict[int, int] = {}
+    # Endpoint order for the next race; the last winner sits in front
+    _polygon_endpoints: deque[str] = deque(POLYGON_RPC_ENDPOINTS)
+    _eth_endpoints: deque[str] = deque(ETH_RPC_ENDPOINTS)
+
+    def __init__(self, client: httpx.AsyncClient | None = None, cache_ttl: float = 15.0):
+        """Pass `client` to share an AsyncClient; the caller closes it."""
+        self._client = client
+        self._owns_client = client is None
+        self.cache_ttl = cache_ttl
 
     async def __aenter__(self):
-        self._client = httpx.AsyncClient(timeout=10.0)
+        if self._owns_client:
+            self._client = httpx.AsyncClient(
+                timeout=http_timeout(10.0),
+                limits=HTTP_LIMITS,
+            )
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        if self._client:
+        if self._owns_client and self._client:
             await self._client.aclose()
 
     @property
@@ -67,32 +160,99 @@ class ChainlinkClient:
         Returns:
             BTC price as float, or None if all RPCs fail.
         """
-        # Try Polygon first (Polymarket uses Polygon Chainlink for resolution)
-        for i in range(len(self.POLYGON_RPC_ENDPOINTS)):
-            rpc_url = self.POLYGON_RPC_ENDPOINTS[(self._polygon_rpc_index + i) % len(self.POLYGON_RPC_ENDPOINTS)]
-            try:
-                price, updated_at = await self._fetch_from_rpc(rpc_url, CHAINLINK_BTC_USD_POLYGON)
-                if price and updated_at:
-                    # Check if data is fresh (< 5 minutes old)
-                    age = int(time.time()) - updated_at
-                    if age < 300:  # 5 minutes
-                        self._polygon_rpc_index = (self._polygon_rpc_index + i) % len(self.POLYGON_RPC_ENDPOINTS)
-                        return price
-            except Exception:
-                continue
-
-        # Fallback to Ethereum mainnet
-        for i in range(len(self.ETH_RPC_ENDPOINTS)):
-            rpc_url = self.ETH_RPC_ENDPOINTS[(self._eth_rpc_index + i) % len(self.ETH_RPC_ENDPOINTS)]
-            try:
-                price, updated_at = await self._fetch_from_rpc(rpc_url, CHAINLINK_BTC_USD_ETH)
-                if price and updated_at:
-                    age = int(time.time()) - updated_at
-                    if age < 3600:  # 1 hour (Ethereum heartbeat)
-                        self._eth_rpc_index = (self._eth_rpc_index + i) % len(self.ETH_RPC_ENDPOINTS)
-                        return price
-            except Exception:
-                continue
+        # The feed only moves on deviation/heartbeat, so a price fetched a
+        # few seconds ago is still the on-chain answer
+        cached = ChainlinkClient._price_cache
+        if cached and time.monotonic() - cached[1] < self.cache_ttl:
+            return cached[0]
+
+        price = await self._fetch_btc_price()
+        if price is not None:
+            ChainlinkClient._price_cache = (price, time.monotonic())
+        return price
+
+    async def _fetch_btc_price(self) -> float | None:
+        """Race the Polygon feed, then the Ethereum feed, for a fresh price."""
+        # Try Polygon first (Polymarket uses Polygon Chainlink for resolution).
+        # Data must be fresh (< 5 minutes old); the cutoff is taken once per
+        # race rather than per response.
+        polygon_cutoff = int(time.time()) - 300
+        winner = await self._race_rpcs(
+            ChainlinkClient._polygon_endpoints,
+            lambda url: self._fetch_from_rpc(url, CHAINLINK_BTC_USD_POLYGON),
+            lambda result: _is_fresh(result, polygon_cutoff),
+            self.RPC_RACE_TIMEOUT,
+        )
+        if winner is not None:
+            return winner[0]
+
+        # Fallback to Ethereum mainnet (1 hour Ethereum heartbeat)
+        eth_cutoff = int(time.time()) - 3600
+        winner = await self._race_rpcs(
+            ChainlinkClient._eth_endpoints,
+            lambda url: self._fetch_from_rpc(url, CHAINLINK_BTC_USD_ETH),
+            lambda result: _is_fresh(result, eth_cutoff),
+            self.RPC_RACE_TIMEOUT,
+        )
+        if winner is not None:
+            return winner[0]
+
+        return None
+
+    async def _race_rpcs(
+        self,
+        endpoints: deque[str],
+        fetch: Callable[[str], Awaitable[T]],
+        accept: Callable[[T], bool],
+        timeout: float,
+    ) -> T | None:
+        """Hedged race across endpoints; first accepted result wins.
+
+        The front endpoint (the last winner) is fired immediately and
+        each following endpoint RPC_HEDGE_DELAY later, so a healthy primary
+        answers before the others spend any quota, while a slow or dead one
+        costs at most a few hedge delays instead of a full timeout.
+
+        Returns the winning result, or None if nothing acceptable arrived
+        within `timeout`. The winner is rotated to the front of `endpoints`
+        and outstanding requests are cancelled.
+        """
+        async def hedged(rank: int, url: str) -> T:
+            if rank:
+                await asyncio.sleep(rank * self.RPC_HEDGE_DELAY)
+            return await fetch(url)
+
+        tasks = {
+            asyncio.ensure_future(hedged(rank, url)): rank
+            for rank, url in enumerate(endpoints)
+        }
+        pending = set(tasks)
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+
+        try:
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending,
+                    timeout=deadline - loop.time(),
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                if not done:
+                    break  # Out of time
+
+                # Prefer the higher-ranked endpoint if several finish together
+                for task in sorted(done, key=tasks.__getitem__):
+                    if task.exception() is not None:
+                        continue
+                    result = task.result()
+                    if accept(result):
+                        endpoints.rotate(-tasks[task])
+                        return result
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
 
         return None
 
@@ -109,99 +269,150 @@ class ChainlinkClient:
         Returns:
             BTC price at that timestamp, or None on failure.
         """
-        for i in range(len(self.POLYGON_RPC_ENDPOINTS)):
-            rpc_url = self.POLYGON_RPC_ENDPOINTS[
-                (self._polygon_rpc_index + i) % len(self.POLYGON_RPC_ENDPOINTS)
-            ]
-            try:
-                price = await self._fetch_at_timestamp(rpc_url, target_ts)
-                if price is not None:
-                    self._polygon_rpc_index = (
-                        (self._polygon_rpc_index + i) % len(self.POLYGON_RPC_ENDPOINTS)
-                    )
-                    return price
-            except Exception:
-                continue
+        cache = ChainlinkClient._historical_cache
+        if target_ts in cache:
+            cache.move_to_end(target_ts)
+            return cache[target_ts]
+
+        price = await self._race_rpcs(
+            ChainlinkClient._polygon_endpoints,
+            lambda url: self._fetch_at_timestamp(url, target_ts),
+            lambda price: price is not None,
+            self.HISTORICAL_RACE_TIMEOUT,
+        )
+        if price is not None:
+            # Only settled history is immutable; a future target reads "latest"
+            if target_ts < time.time():
+                cache[target_ts] = price
+                if len(cache) > self.HISTORICAL_CACHE_SIZE:
+                    cache.popitem(last=False)
+            return price
         return None
 
+    async def _post(self, rpc_url: str, payload: Any) -> httpx.Response:
+        """POST a JSON-RPC payload (or pre-serialized bytes)."""
+        if not isinstance(payload, bytes):
+            payload = json_body(payload)
+        resp = await self.client.post(rpc_url, content=payload, headers=JSON_HEADERS)
+        resp.raise_for_status()
+        return resp
+
+    async def _rpc(self, rpc_url: str, payload: Any) -> Any:
+        """POST a JSON-RPC payload and decode the reply."""
+        return parse_json(await self._post(rpc_url, payload))
+
     async def _fetch_at_timestamp(self, rpc_url: str, target_ts: int) -> float | None:
         """Fetch Chainlink price at a specific timestamp via Polygon block estimation."""
+        cached_block = ChainlinkClient._block_cache.get(target_ts)
+        if cached_block is not None:
+            price, _ = await self._fetch_from_rpc(
+                rpc_url,
+                CHAINLINK_BTC_USD_POLYGON,
+                block=hex(cached_block),
+                want_updated_at=False,
+            )
+            return price
+
         # 1. Get latest block to compute offset
-        resp = await self.client.post(rpc_url, json={
-            "jsonrpc": "2.0",
-            "method": "eth_getBlockByNumber",
-            "params": ["latest", False],
-            "id": 1,
-        })
-        resp.raise_for_status()
-        data = resp.json()
+        data = await self._rpc(rpc_url, LATEST_BLOCK_BODY)
         if "result" not in data or not data["result"]:
             return None
 
-        latest_block = int(data["result"]["number"], 16)
-        latest_ts = int(data["result"]["timestamp"], 16)
+        ref_block = _hex_quantity(data["result"]["number"])
+        ref_ts = _hex_quantity(data["result"]["timestamp"])
+        latest_block = ref_block
 
         # 2. Estimate target block (~2.1s per Polygon block)
-        seconds_back = latest_ts - target_ts
+        seconds_back = ref_ts - target_ts
         if seconds_back < 0:
             # Target is in the future, use latest
             seconds_back = 0
-        blocks_back = int(seconds_back / 2.1)
-        target_block = latest_block - blocks_back
-
-        # 3. Verify and fine-tune
-        resp2 = await self.client.post(rpc_url, json={
-            "jsonrpc": "2.0",
-            "method": "eth_getBlockByNumber",
-            "params": [hex(target_block), False],
-            "id": 2,
-        })
-        resp2.raise_for_status()
-        data2 = resp2.json()
-        if "result" not in data2 or not data2["result"]:
-            return None
-
-        block_ts = int(data2["result"]["timestamp"], 16)
-        diff = block_ts - target_ts
-        if abs(diff) > 5:
-            # Adjust if more than 5 seconds off
-            adjust = int(diff / 2.1)
-            target_block -= adjust
-
-        # 4. Query Chainlink at the target block
-        price, _ = await self._fetch_from_rpc(
-            rpc_url, CHAINLINK_BTC_USD_POLYGON, block=hex(target_block)
-        )
+        target_block = ref_block - int(seconds_back / 2.1)
+
+        # 3. Probe the estimate, reading Chainlink at it in the same batch
+        # request; while it is off, re-estimate from the block time observed
+        # between the last two probes (Polygon drifts between ~2.0-2.3s)
+        for _ in range(self.BLOCK_SEARCH_MAX_PROBES):
+            probed_block = target_block
+            block_hex = hex(probed_block)
+            replies = await self._rpc(rpc_url, [
+                {
+                    "jsonrpc": "2.0",
+                    "method": "eth_getBlockByNumber",
+                    "params": [block_hex, False],
+                    "id": 2,
+                },
+                _eth_call_payload(CHAINLINK_BTC_USD_POLYGON, block_hex, request_id=3),
+            ])
+            if not isinstance(replies, list):
+                return None  # Endpoint rejected the batch
+            by_id = {reply.get("id"): reply for reply in replies}
+            block_reply = by_id.get(2) or {}
+            if not block_reply.get("result"):
+                return None
+
+            block_ts = _hex_quantity(block_reply["result"]["timestamp"])
+            diff = block_ts - target_ts
+            if abs(diff) <= self.BLOCK_SEARCH_TOLERANCE:
+                break
+
+            block_time = 2.1
+            if target_block != ref_block:
+                observed = (ref_ts - block_ts) / (ref_block - target_block)
+                if 1.0 <= observed <= 5.0:
+                    block_time = observed
+            step = round(diff / block_time)
+            if step == 0:
+                break  # Already the nearest block
+            next_block = min(target_block - step, latest_block)
+            if next_block == probed_block:
+                break  # Clamped back to the chain head we just probed
+            ref_block, ref_ts = target_block, block_ts
+            target_block = next_block
+
+        if target_ts < time.time():
+            cache = ChainlinkClient._block_cache
+            cache[target_ts] = probed_block
+            if len(cache) > self.HISTORICAL_CACHE_SIZE:
+                cache.pop(next(iter(cache)))
+
+        price, _ = self._parse_round_data(by_id.get(3) or {}, want_updated_at=False)
         return price
 
-    async def _fetch_from_rpc(self, rpc_url: str, contract: str, block: str = "latest") -> tuple[float | None, int | None]:
+    async def _fetch_from_rpc(
+        self,
+        rpc_url: str,
+        contract: str,
+        block: str = "latest",
+        want_updated_at: bool = True,
+    ) -> tuple[float | None, int | None]:
         """Fetch price from a specific RPC endpoint.
 
         Args:
             rpc_url: RPC endpoint URL.
             contract: Chainlink price feed contract address.
             block: Block number (hex) or "latest".
+            want_updated_at: Skip decoding updatedAt when False.
 
         Returns:
             (price, updated_at_timestamp) or (None, None) on failure.
         """
-        payload = {
-            "jsonrpc": "2.0",
-            "method": "eth_call",
-            "params": [
-                {
-                    "to": contract,
-                    "data": LATEST_ROUND_DATA_SELECTOR,
-                },
-                block,
-            ],
-            "id": 1,
-        }
-
-        resp = await self.client.post(rpc_url, json=payload)
-        resp.raise_for_status()
-        data = resp.json()
-
+        body = LATEST_ROUND_DATA_BODIES.get(contract) if block == "latest" else None
+        payload = body or _eth_call_payload(contract, block)
+
+        resp = await self._post(rpc_url, payload)
+
+        # Successful replies are tiny and compact; pull the hex out directly
+        # and only fall back to a full JSON parse for anything else
+        hex_result = _result_hex(resp.content)
+        if hex_result is not None:
+            return self._decode_round(hex_result, want_updated_at)
+        return self._parse_round_data(parse_json(resp), want_updated_at)
+
+    def _parse_round_data(
+        self, data: dict, want_updated_at: bool = True
+    ) -> tuple[float | None, int | None]:
+        """Decode a latestRoundData() eth_call reply into (price, updated_at)."""
         if "error" in data:
             return None, None
 
@@ -209,27 +420,44 @@ class ChainlinkClient:
         if not result or result == "0x":
             return None, None
 
+        return self._decode_round(result[2:], want_updated_at)  # Remove 0x prefix
+
+    def _decode_round(
+        self, hex_result: str, want_updated_at: bool = True
+    ) -> tuple[float | None, int | None]:
+        """Decode latestRoundData() return words (hex, no 0x) into (price, updated_at).
+
+        updated_at is None when `want_updated_at` is False (historical reads).
+        """
         # latestRoundData returns: (roundId, answer, startedAt, updatedAt, answeredInRound)
-        # answer is at bytes 32-64 (slot 1), 8 decimals
-        # updatedAt is at bytes 96-128 (slot 3)
-        hex_data = result[2:]  # Remove 0x prefix
+        # one 32-byte slot each; answer is int256 with 8 decimals
+        if len(hex_result) < 320:  # Need all 5 slots
+            return None, None
+
+        # Decode the ABI words once (C-level) and slice the bytes
+        raw = bytes.fromhex(hex_result[:320])
 
-        if len(hex_data) < 256:  # Need at least 4 slots
+        # Incomplete round (updatedAt == 0) or negative answer (sign bit set):
+        # reject on the raw bytes before any integer conversion
+        if raw[96:128] == _ZERO_WORD or raw[32] & 0x80:
             return None, None
 
-        # Extract answer (second 32-byte slot)
-        answer_hex = hex_data[64:128]
-        answer_int = int(answer_hex, 16)
+        round_id = int.from_bytes(raw[0:32], "big")
+        answer_int = int.from_bytes(raw[32:64], "big")
+        answered_in_round = int.from_bytes(raw[128:160], "big")
 
-        # Extract updatedAt (fourth 32-byte slot)
-        updated_at_hex = hex_data[192:256]
-        updated_at = int(updated_at_hex, 16)
+        # Reject empty answers and carried-over rounds: a round answered in
+        # an earlier round is stale even when updatedAt looks recent
+        if answer_int == 0 or answered_in_round < round_id:
+            return None, None
 
         # Chainlink BTC/USD has 8 decimals
         price = answer_int / 1e8
 
         # Sanity check
-        if price < 1000 or price > 1000000:
+        if price < self.MIN_SANE_PRICE or price > self.MAX_SANE_PRICE:
             return None, None
 
-        return price, updated_at
+        if not want_updated_at:
+            return price, None
+        return price, int.from_bytes(raw[96:128], "big")
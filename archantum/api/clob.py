@@ -2,39 +2,97 @@
 
 from __future__ import annotations
 
-from typing import Any
+import asyncio
+from typing import Any, NamedTuple
 
 import httpx
-from pydantic import BaseModel
+import numpy as np
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 
+from archantum.api.http import HTTP_LIMITS, http_timeout, parse_json
 from archantum.config import settings
 
 
-class OrderbookLevel(BaseModel):
-    """Single level in an orderbook."""
+class OrderbookLevel(NamedTuple):
+    """Single level in an orderbook (a plain tuple: books can be deep)."""
 
     price: float
     size: float
 
 
+def _empty_prices() -> np.ndarray:
+    return np.empty(0, dtype=np.float64)
+
+
+def _level_arrays(
+    levels: list[dict[str, Any]], descending: bool
+) -> tuple[np.ndarray, np.ndarray]:
+    """Parse raw API levels into (prices, sizes) float arrays, best price first."""
+    n = len(levels)
+    prices = np.fromiter((float(l["price"]) for l in levels), dtype=np.float64, count=n)
+    sizes = np.fromiter((float(l["size"]) for l in levels), dtype=np.float64, count=n)
+    # The API lists each side worst-to-best; sort once so reads are O(1)
+    order = np.argsort(-prices if descending else prices, kind="stable")
+    return prices[order], sizes[order]
+
+
 class Orderbook(BaseModel):
-    """Orderbook data for a token."""
+    """Orderbook data for a token.
+
+    Each side is held as parallel price/size arrays sorted best price
+    first (bids descending, asks ascending), so best prices are index
+    reads and depth is a single numpy reduction; `bids`/`asks` build
+    level objects on demand.
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    bid_prices: np.ndarray = Field(default_factory=_empty_prices)
+    bid_sizes: np.ndarray = Field(default_factory=_empty_prices)
+    ask_prices: np.ndarray = Field(default_factory=_empty_prices)
+    ask_sizes: np.ndarray = Field(default_factory=_empty_prices)
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Orderbook:
+        """Build from a /book response without per-level objects."""
+        bid_prices, bid_sizes = _level_arrays(data.get("bids") or [], descending=True)
+        ask_prices, ask_sizes = _level_arrays(data.get("asks") or [], descending=False)
+        # Arrays are already typed; skip validation
+        return cls.model_construct(
+            bid_prices=bid_prices,
+            bid_sizes=bid_sizes,
+            ask_prices=ask_prices,
+            ask_sizes=ask_sizes,
+        )
+
+    @property
+    def bids(self) -> list[OrderbookLevel]:
+        """Bid levels, highest price first."""
+        return [
+            OrderbookLevel(p, s)
+            for p, s in zip(self.bid_prices.tolist(), self.bid_sizes.tolist())
+        ]
 
-    bids: list[OrderbookLevel] = []
-    asks: list[OrderbookLevel] = []
+    @property
+    def asks(self) -> list[OrderbookLevel]:
+        """Ask levels, lowest price first."""
+        return [
+            OrderbookLevel(p, s)
+            for p, s in zip(self.ask_prices.tolist(), self.ask_sizes.tolist())
+        ]
 
     @property
     def best_bid(self) -> float | None:
         """Get the best bid price."""
-        if self.bids:
-            return max(level.price for level in self.bids)
+        if self.bid_prices.size:
+            return float(self.bid_prices[0])
         return None
 
     @property
     def best_ask(self) -> float | None:
         """Get the best ask price."""
-        if self.asks:
-            return min(level.price for level in self.asks)
+        if self.ask_prices.size:
+            return float(self.ask_prices[0])
         return None
 
     @property
@@ -44,6 +102,16 @@ class Orderbook(BaseModel):
             return self.best_ask - self.best_bid
         return None
 
+    @property
+    def bid_depth_usd(self) -> float:
+        """Total USD resting on the bid side."""
+        return float(self.bid_prices @ self.bid_sizes)
+
+    @property
+    def ask_depth_usd(self) -> float:
+        """Total USD resting on the ask side."""
+        return float(self.ask_prices @ self.ask_sizes)
+
 
 class CLOBMarket(BaseModel):
     """Market data from CLOB API."""
@@ -52,6 +120,10 @@ class CLOBMarket(BaseModel):
     tokens: list[dict[str, Any]] = []
 
 
+# Validates a whole /markets payload in one call
+_CLOB_MARKETS_ADAPTER = TypeAdapter(list[CLOBMarket])
+
+
 class PriceData(BaseModel):
     """Price data for a market."""
 
@@ -82,20 +154,28 @@ class PriceData(BaseModel):
 class CLOBClient:
     """Client for the CLOB API (price/orderbook data)."""
 
-    def __init__(self, base_url: str | None = None):
+    def __init__(
+        self,
+        base_url: str | None = None,
+        client: httpx.AsyncClient | None = None,
+    ):
+        """Pass `client` to share an AsyncClient (with the CLOB base_url); the caller closes it."""
         self.base_url = base_url or settings.clob_api_base_url
-        self._client: httpx.AsyncClient | None = None
+        self._client = client
+        self._owns_client = client is None
 
     async def __aenter__(self):
-        self._client = httpx.AsyncClient(
-            base_url=self.base_url,
-            timeout=30.0,
-            headers={"Accept": "application/json"},
-        )
+        if self._owns_client:
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                timeout=http_timeout(30.0),
+                headers={"Accept": "application/json"},
+                limits=HTTP_LIMITS,
+            )
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        if self._client:
+        if self._owns_client and self._client:
             await self._client.aclose()
 
     @property
@@ -108,32 +188,37 @@ class CLOBClient:
         """Get simplified markets with prices."""
         response = await self.client.get("/markets")
         response.raise_for_status()
-        data = response.json()
+        data = parse_json(response)
 
-        return [CLOBMarket.model_validate(m) for m in data]
+        return _CLOB_MARKETS_ADAPTER.validate_python(data)
 
     async def get_orderbook(self, token_id: str) -> Orderbook:
         """Get orderbook for a specific token."""
         response = await self.client.get("/book", params={"token_id": token_id})
         response.raise_for_status()
-        data = response.json()
+        return Orderbook.from_api(parse_json(response))
 
-        bids = [
-            OrderbookLevel(price=float(b["price"]), size=float(b["size"]))
-            for b in data.get("bids", [])
-        ]
-        asks = [
-            OrderbookLevel(price=float(a["price"]), size=float(a["size"]))
-            for a in data.get("asks", [])
-        ]
+    async def get_orderbooks(self, token_ids: list[str]) -> dict[str, Orderbook]:
+        """Fetch several orderbooks concurrently.
 
-        return Orderbook(bids=bids, asks=asks)
+        Tokens whose request fails are left out of the result.
+        """
+        token_ids = list(dict.fromkeys(token_ids))
+        results = await asyncio.gather(
+            *(self.get_orderbook(token_id) for token_id in token_ids),
+            return_exceptions=True,
+        )
+        return {
+            token_id: book
+            for token_id, book in zip(token_ids, results)
+            if isinstance(book, Orderbook)
+        }
 
     async def get_midpoint(self, token_id: str) -> float | None:
         """Get midpoint price for a token."""
         response = await self.client.get("/midpoint", params={"token_id": token_id})
         response.raise_for_status()
-        data = response.json()
+        data = parse_json(response)
 
         mid = data.get("mid")
         if mid is not None:
@@ -149,24 +234,29 @@ class CLOBClient:
         """Get complete price data for a market."""
         price_data = PriceData(market_id=market_id)
 
-        if yes_token_id:
-            try:
-                yes_book = await self.get_orderbook(yes_token_id)
-                price_data.yes_bid = yes_book.best_bid
-                price_data.yes_ask = yes_book.best_ask
-                midpoint = await self.get_midpoint(yes_token_id)
-                price_data.yes_price = midpoint
-            except httpx.HTTPError:
-                pass
-
-        if no_token_id:
-            try:
-                no_book = await self.get_orderbook(no_token_id)
-                price_data.no_bid = no_book.best_bid
-                price_data.no_ask = no_book.best_ask
-                midpoint = await self.get_midpoint(no_token_id)
-                price_data.no_price = midpoint
-            except httpx.HTTPError:
-                pass
+        # Book and midpoint for both sides in flight at once
+        sides = [
+            (side, token_id)
+            for side, token_id in (("yes", yes_token_id), ("no", no_token_id))
+            if token_id
+        ]
+        results = await asyncio.gather(
+            *(
+                request
+                for _, token_id in sides
+                for request in (self.get_orderbook(token_id), self.get_midpoint(token_id))
+            ),
+            return_exceptions=True,
+        )
+
+        for (side, _), book, midpoint in zip(sides, results[::2], results[1::2]):
+            for result in (book, midpoint):
+                if isinstance(result, BaseException) and not isinstance(result, httpx.HTTPError):
+                    raise result
+            if isinstance(book, Orderbook):
+                setattr(price_data, f"{side}_bid", book.best_bid)
+                setattr(price_data, f"{side}_ask", book.best_ask)
+            if not isinstance(midpoint, BaseException):
+                setattr(price_data, f"{side}_price", midpoint)
 
         return price_data
@@ -2,10 +2,14 @@
 
 from __future__ import annotations
 
-from typing import Any
+import copy
+from typing import Any, Awaitable, Callable, NamedTuple
 
 import httpx
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
+
+from archantum.api.cache import TTLCache
+from archantum.api.http import HTTP_LIMITS, http_timeout, parse_json
 
 
 class LeaderboardEntry(BaseModel):
@@ -25,24 +29,49 @@ class LeaderboardEntry(BaseModel):
         return f"{self.proxy_wallet[:6]}...{self.proxy_wallet[-4:]}"
 
 
-class TradeActivity(BaseModel):
-    """Trade activity for a wallet."""
+class TradeActivity(NamedTuple):
+    """Trade activity for a wallet.
 
-    proxy_wallet: str = Field(alias="proxyWallet")
+    A plain tuple rather than a pydantic model: wallet syncs page through
+    thousands of these, so construction cost and per-row size matter.
+    """
+
+    proxy_wallet: str
     timestamp: int
-    condition_id: str = Field(alias="conditionId")
-    activity_type: str = Field(alias="type")
+    condition_id: str
+    activity_type: str
     size: float  # Token amount
-    usdc_size: float = Field(alias="usdcSize")  # USD value
+    usdc_size: float  # USD value
     price: float
     side: str  # BUY or SELL
-    outcome_index: int = Field(alias="outcomeIndex")
+    outcome_index: int
     title: str  # Market question
     slug: str
-    event_slug: str = Field(alias="eventSlug")
+    event_slug: str
     outcome: str  # Yes or No
-    transaction_hash: str = Field(alias="transactionHash")
-    username: str = Field(default="", alias="name")
+    transaction_hash: str
+    username: str = ""
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> TradeActivity:
+        """Build from one /activity entry (camelCase keys)."""
+        return cls(
+            data["proxyWallet"],
+            int(data["timestamp"]),
+            data["conditionId"],
+            data["type"],
+            float(data["size"]),
+            float(data["usdcSize"]),
+            float(data["price"]),
+            data["side"],
+            int(data["outcomeIndex"]),
+            data["title"],
+            data["slug"],
+            data["eventSlug"],
+            data["outcome"],
+            data["transactionHash"],
+            data.get("name", ""),
+        )
 
     @property
     def polymarket_url(self) -> str:
@@ -58,24 +87,46 @@ class TradeActivity(BaseModel):
             return f"sold {self.outcome}"
 
 
+# Validate whole response lists in one call instead of per entry
+_LEADERBOARD_ADAPTER = TypeAdapter(list[LeaderboardEntry])
+
+
 class DataAPIClient:
     """Client for Polymarket Data API."""
 
     BASE_URL = "https://data-api.polymarket.com"
 
-    def __init__(self):
-        self._client: httpx.AsyncClient | None = None
+    # Leaderboard/wallet-stats responses, shared by all instances since
+    # callers open a short-lived client per task
+    _cache = TTLCache(ttl=30.0, max_entries=1024)
+
+    def __init__(self, client: httpx.AsyncClient | None = None):
+        """Pass `client` to share an AsyncClient (with base_url=BASE_URL); the caller closes it."""
+        self._client = client
+        self._owns_client = client is None
+
+    @classmethod
+    def invalidate(cls) -> None:
+        """Drop all cached leaderboard and wallet-stats responses."""
+        cls._cache.clear()
+
+    async def _cached(self, key: tuple, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        """Return a copy of the cached value for `key`, fetching it on a miss."""
+        # Copied so callers can't mutate the shared cached value
+        return copy.copy(await DataAPIClient._cache.get_or_fetch(key, fetch))
 
     async def __aenter__(self):
-        self._client = httpx.AsyncClient(
-            base_url=self.BASE_URL,
-            timeout=30.0,
-            headers={"Accept": "application/json"},
-        )
+        if self._owns_client:
+            self._client = httpx.AsyncClient(
+                base_url=self.BASE_URL,
+                timeout=http_timeout(30.0),
+                headers={"Accept": "application/json"},
+                limits=HTTP_LIMITS,
+            )
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        if self._client:
+        if self._owns_client and self._client:
             await self._client.aclose()
 
     @property
@@ -112,11 +163,14 @@ class DataAPIClient:
             "offset": offset,
         }
 
-        response = await self.client.get("/v1/leaderboard", params=params)
-        response.raise_for_status()
-        data = response.json()
+        async def fetch() -> list[LeaderboardEntry]:
+            response = await self.client.get("/v1/leaderboard", params=params)
+            response.raise_for_status()
+            data = parse_json(response)
+            return _LEADERBOARD_ADAPTER.validate_python(data)
 
-        return [LeaderboardEntry.model_validate(entry) for entry in data]
+        key = ("leaderboard", time_period, order_by, category, params["limit"], offset)
+        return await self._cached(key, fetch)
 
     async def get_wallet_activity(
         self,
@@ -154,9 +208,9 @@ class DataAPIClient:
 
         response = await self.client.get("/activity", params=params)
         response.raise_for_status()
-        data = response.json()
+        data = parse_json(response)
 
-        return [TradeActivity.model_validate(trade) for trade in data]
+        return [TradeActivity.from_api(trade) for trade in data]
 
     async def get_wallet_stats(self, wallet: str) -> dict[str, Any]:
         """Get aggregated stats for a wallet.
@@ -168,10 +222,10 @@ class DataAPIClient:
             "timePeriod": "ALL",
         }
 
-        response = await self.client.get("/v1/leaderboard", params=params)
-        response.raise_for_status()
-        data = response.json()
+        async def fetch() -> dict[str, Any]:
+            response = await self.client.get("/v1/leaderboard", params=params)
+            response.raise_for_status()
+            data = parse_json(response)
+            return data[0] if data else {}
 
-        if data:
-            return data[0]
-        return {}
+        return await self._cached(("stats", wallet), fetch)
@@ -2,15 +2,51 @@
 
 from __future__ import annotations
 
-import json
-from typing import Any
+import asyncio
+import heapq
+from datetime import datetime
+from functools import cached_property
+from typing import Annotated, Any, AsyncIterator, Union
 
 import httpx
-from pydantic import BaseModel, ConfigDict, Field, field_validator
+from pydantic import AfterValidator, BaseModel, ConfigDict, Field, Json, TypeAdapter
+from typing_extensions import TypedDict
 
+from archantum.api.cache import TTLCache
+from archantum.api.http import http_timeout, parse_json, shared_transport
+from archantum.api.search import TrigramIndex
 from archantum.config import settings
 
 
+def _malformed_json(_: str) -> None:
+    return None
+
+
+# List of strings that Gamma sends JSON-encoded ('["Yes", "No"]'). Decoding
+# happens inside pydantic-core; only a malformed string reaches the Python
+# fallback, which maps it to None instead of failing the whole page.
+_JsonStrList = Annotated[
+    Union[
+        Json[list[str]],
+        list[str],
+        Annotated[str, AfterValidator(_malformed_json)],
+        None,
+    ],
+    Field(union_mode="left_to_right"),
+]
+
+
+class EventRef(TypedDict, total=False):
+    """The parts of a market's parent event that we use.
+
+    Gamma embeds full event objects (descriptions, tags, series) in every
+    market; only these keys are kept, everything else is skipped at parse.
+    """
+
+    slug: str | None
+    title: str | None
+
+
 class GammaMarket(BaseModel):
     """Market data from Gamma API."""
 
@@ -21,31 +57,30 @@ class GammaMarket(BaseModel):
     question: str
     slug: str | None = None
     event_slug: str | None = Field(default=None, alias="eventSlug")
-    outcomes: list[str] | None = None
-    outcome_prices: list[str] | None = Field(default=None, alias="outcomePrices")
+    outcomes: _JsonStrList = None
+    outcome_prices: _JsonStrList = Field(default=None, alias="outcomePrices")
     volume: float | None = None
     volume_24hr: float | None = Field(default=None, alias="volume24hr")
     liquidity: float | None = None
     active: bool = True
     closed: bool = False
-    clob_token_ids: list[str] | None = Field(default=None, alias="clobTokenIds")
+    clob_token_ids: _JsonStrList = Field(default=None, alias="clobTokenIds")
     end_date: str | None = Field(default=None, alias="endDate")
-    events: list[dict[str, Any]] | None = None
+    events: list[EventRef] | None = None
 
-    @field_validator("outcomes", "outcome_prices", "clob_token_ids", mode="before")
-    @classmethod
-    def parse_json_string(cls, v):
-        """Parse JSON string to list if needed."""
-        if isinstance(v, str):
-            try:
-                return json.loads(v)
-            except json.JSONDecodeError:
-                return None
-        return v
+    @cached_property
+    def end_dt(self) -> datetime | None:
+        """End date as a naive UTC datetime, parsed once; None if missing or invalid."""
+        if not self.end_date:
+            return None
+        try:
+            return datetime.fromisoformat(self.end_date.replace("Z", "+00:00")).replace(tzinfo=None)
+        except ValueError:
+            return None
 
-    @property
+    @cached_property
     def yes_token_id(self) -> str | None:
-        """Get the YES outcome token ID."""
+        """Get the YES outcome token ID (looked up once per market)."""
         if self.clob_token_ids and self.outcomes:
             try:
                 idx = self.outcomes.index("Yes")
@@ -54,9 +89,9 @@ class GammaMarket(BaseModel):
                 pass
         return None
 
-    @property
+    @cached_property
     def no_token_id(self) -> str | None:
-        """Get the NO outcome token ID."""
+        """Get the NO outcome token ID (looked up once per market)."""
         if self.clob_token_ids and self.outcomes:
             try:
                 idx = self.outcomes.index("No")
@@ -79,18 +114,41 @@ class GammaMarket(BaseModel):
         return None
 
 
+class GammaEvent(BaseModel):
+    """Event from Gamma API with its markets."""
+
+    slug: str | None = None
+    title: str | None = None
+    markets: list[GammaMarket] = []
+
+
+# Validates whole market lists (raw bytes or decoded) in one pydantic-core call
+_MARKETS_ADAPTER = TypeAdapter(list[GammaMarket])
+_EVENTS_ADAPTER = TypeAdapter(list[GammaEvent])
+
+
 class GammaClient:
     """Client for the Gamma API (market discovery)."""
 
+    # Offset pages requested at once when paginating past the first page
+    PAGE_CONCURRENCY = 8
+
+    # Market lists fetched for text search, shared by all instances since
+    # callers open a short-lived client per lookup
+    _search_cache = TTLCache(ttl=30.0)
+
     def __init__(self, base_url: str | None = None):
         self.base_url = base_url or settings.gamma_api_base_url
         self._client: httpx.AsyncClient | None = None
+        # Parsed once; an absolute URL skips the base_url merge on every page
+        self._markets_url = httpx.URL(self.base_url.rstrip("/") + "/markets")
 
     async def __aenter__(self):
         self._client = httpx.AsyncClient(
             base_url=self.base_url,
-            timeout=30.0,
+            timeout=http_timeout(30.0),
             headers={"Accept": "application/json"},
+            transport=shared_transport(),
         )
         return self
 
@@ -112,40 +170,62 @@ class GammaClient:
         offset: int = 0,
     ) -> list[GammaMarket]:
         """Fetch markets from Gamma API with pagination."""
-        params = {
-            "closed": str(closed).lower(),
-            "active": str(active).lower(),
-            "limit": limit,
-            "offset": offset,
-        }
+        return await self._fetch_market_page(
+            self._market_params(closed, active, limit), offset
+        )
 
-        response = await self.client.get("/markets", params=params)
+    @staticmethod
+    def _market_params(closed: bool, active: bool, limit: int) -> list[tuple[str, Any]]:
+        """Query parameters shared by every page of a market listing."""
+        return [
+            ("closed", "true" if closed else "false"),
+            ("active", "true" if active else "false"),
+            ("limit", limit),
+        ]
+
+    async def _fetch_market_page(
+        self, base_params: list[tuple[str, Any]], offset: int
+    ) -> list[GammaMarket]:
+        """Fetch one page of markets, adding only the offset to the shared params."""
+        response = await self.client.get(
+            self._markets_url, params=[*base_params, ("offset", offset)]
+        )
         response.raise_for_status()
-        data = response.json()
 
-        return [GammaMarket.model_validate(m) for m in data]
+        return _MARKETS_ADAPTER.validate_json(response.content)
+
+    async def _active_market_pages(
+        self, limit_per_page: int
+    ) -> AsyncIterator[list[GammaMarket]]:
+        """Yield active-market pages in offset order, stopping after a short page.
+
+        The first page is fetched alone (most polls fit in it); after that,
+        offset pages are independent, so PAGE_CONCURRENCY are requested at once.
+        """
+        base_params = self._market_params(False, True, limit_per_page)
+        pages = [await self._fetch_market_page(base_params, 0)]
+        offset = limit_per_page
+
+        while True:
+            for page in pages:
+                if not page:
+                    return
+                yield page
+                if len(page) < limit_per_page:
+                    return
+
+            pages = await asyncio.gather(*(
+                self._fetch_market_page(base_params, offset + i * limit_per_page)
+                for i in range(self.PAGE_CONCURRENCY)
+            ))
+            offset += self.PAGE_CONCURRENCY * limit_per_page
 
     async def get_all_active_markets(self, limit_per_page: int = 100) -> list[GammaMarket]:
         """Fetch all active markets with automatic pagination."""
         all_markets: list[GammaMarket] = []
-        offset = 0
-
-        while True:
-            markets = await self.get_markets(
-                closed=False,
-                active=True,
-                limit=limit_per_page,
-                offset=offset,
-            )
-
-            if not markets:
-                break
 
+        async for markets in self._active_market_pages(limit_per_page):
             all_markets.extend(markets)
-            offset += limit_per_page
-
-            if len(markets) < limit_per_page:
-                break
 
         return all_markets
 
@@ -163,36 +243,33 @@ class GammaClient:
         min_vol = min_volume_24hr if min_volume_24hr is not None else settings.min_volume_24hr
         max_count = max_markets if max_markets is not None else settings.max_markets
 
-        all_markets: list[GammaMarket] = []
-        offset = 0
-        limit_per_page = 100
+        if max_count <= 0:
+            return []
 
-        # Fetch until we have enough high-volume markets
-        while len(all_markets) < max_count * 2:  # Fetch extra to filter
-            markets = await self.get_markets(
-                closed=False,
-                active=True,
-                limit=limit_per_page,
-                offset=offset,
-            )
-
-            if not markets:
-                break
+        # Min-heap of the max_count highest-volume markets seen so far;
+        # -seq keeps the earlier market ahead on equal volume
+        top: list[tuple[float, int, GammaMarket]] = []
+        matched = 0
 
+        # Fetch until we have enough high-volume markets
+        async for markets in self._active_market_pages(limit_per_page=100):
             # Filter by minimum volume
             for m in markets:
                 vol = m.volume_24hr or 0
                 if vol >= min_vol:
-                    all_markets.append(m)
-
-            offset += limit_per_page
-
-            if len(markets) < limit_per_page:
+                    entry = (vol, -matched, m)
+                    matched += 1
+                    if len(top) < max_count:
+                        heapq.heappush(top, entry)
+                    elif entry[:2] > top[0][:2]:
+                        heapq.heapreplace(top, entry)
+
+            if matched >= max_count * 2:  # Fetch extra to filter
                 break
 
-        # Sort by 24h volume descending and limit
-        all_markets.sort(key=lambda m: m.volume_24hr or 0, reverse=True)
-        return all_markets[:max_count]
+        # Highest 24h volume first
+        top.sort(reverse=True)
+        return [m for _, _, m in top]
 
     async def get_events(
         self,
@@ -209,14 +286,14 @@ class GammaClient:
 
         response = await self.client.get("/events", params=params)
         response.raise_for_status()
-        return response.json()
+        return parse_json(response)
 
     async def get_event_by_slug(self, slug: str) -> dict[str, Any] | None:
         """Fetch a specific event by its slug."""
         try:
             response = await self.client.get("/events", params={"slug": slug})
             response.raise_for_status()
-            events = response.json()
+            events = parse_json(response)
             if events and len(events) > 0:
                 return events[0]
             return None
@@ -225,32 +302,35 @@ class GammaClient:
 
     async def get_markets_by_event_slug(self, event_slug: str) -> list[GammaMarket]:
         """Fetch all markets for a specific event."""
-        event = await self.get_event_by_slug(event_slug)
-        if not event:
+        try:
+            response = await self.client.get("/events", params={"slug": event_slug})
+            response.raise_for_status()
+        except httpx.HTTPStatusError:
             return []
 
-        # Extract markets from event and add event info to each market
-        markets_data = event.get("markets", [])
-        event_info = {"slug": event.get("slug"), "title": event.get("title")}
+        # The event's markets are validated once, while parsing the body
+        events = _EVENTS_ADAPTER.validate_json(response.content)
+        if not events:
+            return []
+        event = events[0]
 
-        markets = []
-        for m in markets_data:
-            # Add events array so polymarket_url works correctly
-            m["events"] = [event_info]
-            markets.append(GammaMarket.model_validate(m))
+        # Add events array so polymarket_url works correctly; the models are
+        # already validated, so plain assignment suffices
+        event_info = {"slug": event.slug, "title": event.title}
+        for market in event.markets:
+            market.events = [event_info]
 
-        return markets
+        return event.markets
 
     async def search_markets(self, query: str, limit: int = 20) -> list[GammaMarket]:
         """Search markets by text query."""
-        # Gamma API doesn't have a search endpoint, so we fetch and filter
-        all_markets = await self.get_markets(limit=500)
-        query_lower = query.lower()
-
-        matching = [
-            m for m in all_markets
-            if query_lower in m.question.lower()
-            or (m.slug and query_lower in m.slug.lower())
-        ]
+        # Gamma API doesn't have a search endpoint, so we fetch and filter;
+        # the fetched list is indexed and reused across searches for a short
+        # while
+        async def build_index() -> TrigramIndex[GammaMarket]:
+            markets = await self.get_markets(limit=500)
+            return TrigramIndex([(f"{m.question}\n{m.slug or ''}", m) for m in markets])
+
+        index = await GammaClient._search_cache.get_or_fetch("markets", build_index)
 
-        return matching[:limit]
+        return index.search(query, limit)
@@ -0,0 +1,108 @@
+"""Shared httpx connection settings for the API clients."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import httpx
+import orjson
+
+# Pool sized for concurrent fan-out (orderbooks, wallet syncs, RPC races);
+# idle connections stay warm between polls so requests skip the TLS handshake
+HTTP_LIMITS = httpx.Limits(
+    max_connections=100,
+    max_keepalive_connections=20,
+    keepalive_expiry=60.0,
+)
+
+# Header for request bodies pre-serialized with orjson (`content=` uploads
+# carry no content type of their own)
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+def http_timeout(read: float) -> httpx.Timeout:
+    """Timeout with the given read budget but a short connect budget.
+
+    An unreachable host fails in seconds instead of holding a request for
+    the full read timeout.
+    """
+    return httpx.Timeout(read, connect=3.0)
+
+
+def http_transport(retries: int = 2) -> httpx.AsyncHTTPTransport:
+    """Pooled transport that retries failed connection attempts.
+
+    Only connect errors are retried, so non-idempotent requests are never
+    replayed after reaching the server.
+    """
+    return httpx.AsyncHTTPTransport(limits=HTTP_LIMITS, retries=retries)
+
+
+class _TransportLease(httpx.AsyncBaseTransport):
+    """One client's hold on the shared transport; closing it drops the hold."""
+
+    def __init__(self, transport: httpx.AsyncHTTPTransport):
+        self._transport = transport
+        self._released = False
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        return await self._transport.handle_async_request(request)
+
+    async def aclose(self) -> None:
+        if not self._released:
+            self._released = True
+            await _release_shared_transport(self._transport)
+
+
+# Pool shared by clients that use shared_transport(), with its holder count
+# and the event loop its connections belong to
+_shared_transport: httpx.AsyncHTTPTransport | None = None
+_shared_refs = 0
+_shared_loop: asyncio.AbstractEventLoop | None = None
+
+
+def shared_transport() -> httpx.AsyncBaseTransport:
+    """Lease on a process-wide pooled transport.
+
+    Clients for different hosts share one pool (httpx keeps connections per
+    origin inside it), so DNS, keepalive caps and idle sockets are pooled
+    together. The pool closes when the last lease is closed, which happens
+    when its AsyncClient is closed.
+    """
+    global _shared_transport, _shared_refs, _shared_loop
+
+    loop = asyncio.get_running_loop()
+    if _shared_transport is None or _shared_loop is not loop:
+        # Connections can't outlive their loop; leases left on a finished
+        # loop keep the old pool to themselves
+        _shared_transport = http_transport()
+        _shared_refs = 0
+        _shared_loop = loop
+    _shared_refs += 1
+    return _TransportLease(_shared_transport)
+
+
+async def _release_shared_transport(transport: httpx.AsyncHTTPTransport) -> None:
+    global _shared_transport, _shared_refs, _shared_loop
+
+    if transport is not _shared_transport:
+        # Pool was superseded by a newer loop's; nothing else uses it
+        await transport.aclose()
+        return
+
+    _shared_refs -= 1
+    if _shared_refs == 0:
+        _shared_transport = None
+        _shared_loop = None
+        await transport.aclose()
+
+
+def json_body(payload: Any) -> bytes:
+    """Serialize a request body with orjson."""
+    return orjson.dumps(payload)
+
+
+def parse_json(response: httpx.Response) -> Any:
+    """Decode a JSON response body with orjson instead of stdlib json."""
+    return orjson.loads(response.content)
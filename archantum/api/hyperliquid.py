@@ -4,6 +4,11 @@ from __future__ import annotations
 
 import httpx
 
+from archantum.api.http import JSON_HEADERS, http_timeout, json_body, parse_json, shared_transport
+
+# allMids request body, serialized once for every poll
+ALL_MIDS_BODY = json_body({"type": "allMids"})
+
 
 class HyperliquidClient:
     """Client for Hyperliquid API (BTC mid price)."""
@@ -14,7 +19,10 @@ class HyperliquidClient:
         self._client: httpx.AsyncClient | None = None
 
     async def __aenter__(self):
-        self._client = httpx.AsyncClient(timeout=10.0)
+        self._client = httpx.AsyncClient(
+            timeout=http_timeout(10.0),
+            transport=shared_transport(),
+        )
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
@@ -40,8 +48,9 @@ class HyperliquidClient:
         """
         resp = await self.client.post(
             self.API_URL,
-            json={"type": "allMids"},
+            content=ALL_MIDS_BODY,
+            headers=JSON_HEADERS,
         )
         resp.raise_for_status()
-        data = resp.json()
+        data = parse_json(resp)
         return float(data["BTC"])
@@ -8,8 +8,12 @@ from typing import Any
 import httpx
 from pydantic import BaseModel, Field
 
+from archantum.api.cache import TTLCache
+from archantum.api.http import http_timeout, parse_json, shared_transport
+from archantum.api.search import TrigramIndex
 
-@dataclass
+
+@dataclass(frozen=True)
 class KalshiPriceData:
     """Price data from Kalshi."""
 
@@ -78,11 +82,22 @@ class KalshiMarket(BaseModel):
         )
 
 
+class KalshiMarketsPage(BaseModel):
+    """One page of the /markets listing."""
+
+    markets: list[KalshiMarket] = []
+    cursor: str | None = None
+
+
 class KalshiClient:
     """Client for the Kalshi API (market data - no auth required)."""
 
     BASE_URL = "https://api.elections.kalshi.com/trade-api/v2"
 
+    # Market lists fetched for text search, shared by all instances since
+    # callers open a short-lived client per lookup
+    _search_cache = TTLCache(ttl=30.0)
+
     def __init__(self, base_url: str | None = None):
         self.base_url = base_url or self.BASE_URL
         self._client: httpx.AsyncClient | None = None
@@ -90,8 +105,9 @@ class KalshiClient:
     async def __aenter__(self):
         self._client = httpx.AsyncClient(
             base_url=self.base_url,
-            timeout=30.0,
+            timeout=http_timeout(30.0),
             headers={"Accept": "application/json"},
+            transport=shared_transport(),
         )
         return self
 
@@ -138,12 +154,10 @@ class KalshiClient:
 
         response = await self.client.get("/markets", params=params)
         response.raise_for_status()
-        data = response.json()
-
-        markets = [KalshiMarket.model_validate(m) for m in data.get("markets", [])]
-        next_cursor = data.get("cursor")
 
-        return markets, next_cursor
+        # Parse and validate the body in a single pydantic-core pass
+        page = KalshiMarketsPage.model_validate_json(response.content)
+        return page.markets, page.cursor
 
     async def get_all_open_markets(self, max_markets: int = 500) -> list[KalshiMarket]:
         """Fetch all open markets with pagination.
@@ -179,7 +193,7 @@ class KalshiClient:
         try:
             response = await self.client.get(f"/markets/{ticker}")
             response.raise_for_status()
-            data = response.json()
+            data = parse_json(response)
             return KalshiMarket.model_validate(data.get("market", data))
         except httpx.HTTPStatusError:
             return None
@@ -189,19 +203,18 @@ class KalshiClient:
         try:
             response = await self.client.get(f"/markets/{ticker}/orderbook")
             response.raise_for_status()
-            return response.json()
+            return parse_json(response)
         except httpx.HTTPStatusError:
             return None
 
     async def search_markets(self, query: str, limit: int = 20) -> list[KalshiMarket]:
         """Search markets by text (searches in title)."""
-        all_markets = await self.get_all_open_markets(max_markets=500)
-        query_lower = query.lower()
+        # The fetched list is indexed and reused across searches for a
+        # short while
+        async def build_index() -> TrigramIndex[KalshiMarket]:
+            markets = await self.get_all_open_markets(max_markets=500)
+            return TrigramIndex([(f"{m.title}\n{m.subtitle or ''}", m) for m in markets])
 
-        matching = [
-            m for m in all_markets
-            if query_lower in m.title.lower()
-            or (m.subtitle and query_lower in m.subtitle.lower())
-        ]
+        index = await KalshiClient._search_cache.get_or_fetch("open_markets", build_index)
 
-        return matching[:limit]
+        return index.search(query, limit)
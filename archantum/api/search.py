@@ -0,0 +1,45 @@
+"""Substring search over cached market lists."""
+
+from __future__ import annotations
+
+from typing import Generic, TypeVar
+
+T = TypeVar("T")
+
+
+class TrigramIndex(Generic[T]):
+    """Case-insensitive substring index over (text, item) pairs.
+
+    Each text's 3-grams map to the positions containing them, so a query of
+    three or more characters only verifies the positions holding all of its
+    3-grams. Shorter queries fall back to a linear scan. Results keep the
+    original item order.
+    """
+
+    def __init__(self, entries: list[tuple[str, T]]):
+        self._texts = [text.lower() for text, _ in entries]
+        self._items = [item for _, item in entries]
+        self._postings: dict[str, set[int]] = {}
+        for pos, text in enumerate(self._texts):
+            for i in range(len(text) - 2):
+                self._postings.setdefault(text[i:i + 3], set()).add(pos)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def search(self, query: str, limit: int | None = None) -> list[T]:
+        """Items whose text contains `query`, in original order."""
+        query = query.lower()
+        if len(query) < 3:
+            positions = range(len(self._texts))
+        else:
+            grams = {query[i:i + 3] for i in range(len(query) - 2)}
+            postings = sorted(
+                (self._postings.get(gram, set()) for gram in grams), key=len
+            )
+            candidates = set(postings[0]).intersection(*postings[1:])
+            positions = sorted(candidates)
+
+        texts = self._texts
+        matches = [self._items[pos] for pos in positions if query in texts[pos]]
+        return matches if limit is None else matches[:limit]
@@ -3,11 +3,11 @@
 from __future__ import annotations
 
 import asyncio
-import json
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Callable, Any
 
+import orjson
 import websockets
 from websockets.asyncio.client import ClientConnection
 from rich.console import Console
@@ -17,6 +17,16 @@ from archantum.config import settings
 
 console = Console()
 
+# First character of a JSON frame; anything else is a plain-text status reply
+_JSON_PREFIXES = ("{", "[", b"{", b"[")
+
+# Polymarket accepts at most this many asset IDs per subscribe message
+_SUBSCRIBE_BATCH_SIZE = 500
+
+# Messages handled from one batched frame before yielding to the event loop,
+# so a burst of book snapshots doesn't hold off pings and other tasks
+_BATCH_YIELD_EVERY = 32
+
 
 @dataclass
 class WebSocketStats:
@@ -67,6 +77,7 @@ class PolymarketWebSocket:
     # Internal state
     _ws: ClientConnection | None = field(default=None, repr=False)
     _token_to_market: dict[str, tuple[str, str]] = field(default_factory=dict)  # token_id -> (market_id, outcome)
+    _market_to_tokens: dict[str, dict[str, str]] = field(default_factory=dict)  # market_id -> {outcome: token_id}
     _subscribed_markets: set[str] = field(default_factory=set)
     _running: bool = False
     _reconnect_task: asyncio.Task | None = field(default=None, repr=False)
@@ -79,8 +90,8 @@ class PolymarketWebSocket:
     _max_reconnect_delay: float = 160.0
     _max_reconnect_attempts: int = 10
 
-    # Price cache for quick access
-    _price_cache: dict[str, PriceUpdate] = field(default_factory=dict)
+    # Price cache for quick access, keyed by (market_id, outcome)
+    _price_cache: dict[tuple[str, str], PriceUpdate] = field(default_factory=dict)
 
     async def connect(self) -> None:
         """Connect to WebSocket server."""
@@ -174,19 +185,15 @@ class PolymarketWebSocket:
         if not self._ws or not self.stats.is_connected:
             # Store for later subscription
             self._subscribed_markets.add(market_id)
-            if yes_token:
-                self._token_to_market[yes_token] = (market_id, "yes")
-            if no_token:
-                self._token_to_market[no_token] = (market_id, "no")
+            self._register_tokens(market_id, yes_token, no_token)
             return
 
         assets = []
         if yes_token:
             assets.append({"asset_id": yes_token})
-            self._token_to_market[yes_token] = (market_id, "yes")
         if no_token:
             assets.append({"asset_id": no_token})
-            self._token_to_market[no_token] = (market_id, "no")
+        self._register_tokens(market_id, yes_token, no_token)
 
         if not assets:
             return
@@ -201,7 +208,7 @@ class PolymarketWebSocket:
         }
 
         try:
-            await self._ws.send(json.dumps(subscribe_msg))
+            await self._ws.send(orjson.dumps(subscribe_msg).decode())
             console.print(f"[dim]Subscribed to market {market_id[:8]}...[/dim]")
         except Exception as e:
             console.print(f"[yellow]Failed to subscribe to {market_id}: {e}[/yellow]")
@@ -220,10 +227,7 @@ class PolymarketWebSocket:
                 yes_token = market.get("yes_token")
                 no_token = market.get("no_token")
                 self._subscribed_markets.add(market_id)
-                if yes_token:
-                    self._token_to_market[yes_token] = (market_id, "yes")
-                if no_token:
-                    self._token_to_market[no_token] = (market_id, "no")
+                self._register_tokens(market_id, yes_token, no_token)
             return
 
         # Collect all token IDs for batch subscription
@@ -234,37 +238,61 @@ class PolymarketWebSocket:
             no_token = market.get("no_token")
 
             self._subscribed_markets.add(market_id)
+            self._register_tokens(market_id, yes_token, no_token)
             if yes_token:
-                self._token_to_market[yes_token] = (market_id, "yes")
                 all_tokens.append(yes_token)
             if no_token:
-                self._token_to_market[no_token] = (market_id, "no")
                 all_tokens.append(no_token)
 
         if not all_tokens:
             return
 
-        # Batch subscribe (max 500 per message)
-        batch_size = 500
-        for i in range(0, len(all_tokens), batch_size):
-            batch = all_tokens[i:i + batch_size]
+        batches = await self._send_token_batches(all_tokens)
+        console.print(f"[dim]Subscribed to {len(all_tokens)} tokens in {batches} batches[/dim]")
+
+    async def _send_token_batches(self, tokens: list[str]) -> int:
+        """Send subscribe messages of up to _SUBSCRIBE_BATCH_SIZE tokens each.
+
+        Returns the number of batches sent successfully.
+        """
+        sent = 0
+        for i in range(0, len(tokens), _SUBSCRIBE_BATCH_SIZE):
             subscribe_msg = {
-                "assets_ids": batch,
+                "assets_ids": tokens[i:i + _SUBSCRIBE_BATCH_SIZE],
                 "type": "market",
             }
             try:
-                await self._ws.send(json.dumps(subscribe_msg))
-                console.print(f"[dim]Subscribed to {len(batch)} tokens (batch {i // batch_size + 1})[/dim]")
+                await self._ws.send(orjson.dumps(subscribe_msg).decode())
+                sent += 1
             except Exception as e:
                 console.print(f"[yellow]Failed to subscribe batch: {e}[/yellow]")
                 self.stats.errors += 1
+        return sent
+
+    def _register_tokens(
+        self,
+        market_id: str,
+        yes_token: str | None,
+        no_token: str | None,
+    ) -> None:
+        """Map a market's outcome tokens in both directions."""
+        for token_id, outcome in ((yes_token, "yes"), (no_token, "no")):
+            if not token_id:
+                continue
+            previous = self._token_to_market.get(token_id)
+            if previous and previous != (market_id, outcome):
+                # Token was remapped; drop its old reverse entry
+                old_tokens = self._market_to_tokens.get(previous[0], {})
+                if old_tokens.get(previous[1]) == token_id:
+                    del old_tokens[previous[1]]
+            self._token_to_market[token_id] = (market_id, outcome)
+            self._market_to_tokens.setdefault(market_id, {})[outcome] = token_id
 
     def get_cached_price(self, market_id: str, outcome: str = "yes") -> PriceUpdate | None:
         """Get cached price for a market outcome."""
-        cache_key = f"{market_id}_{outcome}"
-        return self._price_cache.get(cache_key)
+        return self._price_cache.get((market_id, outcome))
 
-    def get_all_cached_prices(self) -> dict[str, PriceUpdate]:
+    def get_all_cached_prices(self) -> dict[tuple[str, str], PriceUpdate]:
         """Get all cached prices."""
         return self._price_cache.copy()
 
@@ -298,7 +326,7 @@ class PolymarketWebSocket:
             except Exception:
                 pass  # Ignore ping errors
 
-    async def _handle_message(self, raw_message: str) -> None:
+    async def _handle_message(self, raw_message: str | bytes) -> None:
         """Handle incoming WebSocket message."""
         # Handle text responses (PONG, errors, etc.)
         if raw_message == "PONG":
@@ -307,27 +335,29 @@ class PolymarketWebSocket:
             # Server rejected subscription - likely wrong format or invalid token
             self.stats.errors += 1
             return
-        if not raw_message.startswith("{") and not raw_message.startswith("["):
+        if raw_message[:1] not in _JSON_PREFIXES:
             # Not JSON, ignore other text messages
             return
 
         try:
-            data = json.loads(raw_message)
+            data = orjson.loads(raw_message)
             self.stats.messages_received += 1
             self.stats.last_message_at = datetime.utcnow()
 
             # Handle array of messages
             if isinstance(data, list):
-                for item in data:
+                for i, item in enumerate(data, 1):
                     if isinstance(item, dict):
                         await self._process_single_message(item)
+                    if i % _BATCH_YIELD_EVERY == 0:
+                        await asyncio.sleep(0)
                 return
 
             # Handle single message
             if isinstance(data, dict):
                 await self._process_single_message(data)
 
-        except json.JSONDecodeError:
+        except orjson.JSONDecodeError:
             pass  # Silently ignore malformed JSON
         except Exception as e:
             console.print(f"[yellow]Error handling message: {e}[/yellow]")
@@ -379,9 +409,8 @@ class PolymarketWebSocket:
             outcome=outcome,
         )
 
-        # Cache the update
-        cache_key = f"{market_id}_{outcome}"
-        self._price_cache[cache_key] = update
+        # Cache the update; market_info is already the (market_id, outcome) key
+        self._price_cache[market_info] = update
 
         # Call callback if registered
         if self.on_price_update:
@@ -417,8 +446,7 @@ class PolymarketWebSocket:
                 outcome=outcome,
             )
 
-            cache_key = f"{market_id}_{outcome}"
-            self._price_cache[cache_key] = update
+            self._price_cache[market_info] = update
 
             if self.on_price_update:
                 await self._safe_callback(self.on_price_update, update)
@@ -450,8 +478,7 @@ class PolymarketWebSocket:
             outcome=outcome,
         )
 
-        cache_key = f"{market_id}_{outcome}"
-        self._price_cache[cache_key] = update
+        self._price_cache[market_info] = update
 
         if self.on_price_update:
             await self._safe_callback(self.on_price_update, update)
@@ -490,33 +517,19 @@ class PolymarketWebSocket:
 
     async def _resubscribe_all(self) -> None:
         """Resubscribe to all markets after reconnection."""
-        console.print(f"[cyan]Resubscribing to {len(self._subscribed_markets)} markets...[/cyan]")
-
-        # Group tokens by market for efficient subscription
-        markets_to_subscribe = []
+        # One token list for every market, sent in as few frames as possible
+        all_tokens = []
         for market_id in self._subscribed_markets:
-            yes_token = None
-            no_token = None
-            for token_id, (mid, outcome) in self._token_to_market.items():
-                if mid == market_id:
-                    if outcome == "yes":
-                        yes_token = token_id
-                    else:
-                        no_token = token_id
-
-            if yes_token or no_token:
-                markets_to_subscribe.append({
-                    "id": market_id,
-                    "yes_token": yes_token,
-                    "no_token": no_token,
-                })
-
-        for market in markets_to_subscribe:
-            await self.subscribe_market(
-                market_id=market["id"],
-                yes_token=market.get("yes_token"),
-                no_token=market.get("no_token"),
-            )
+            all_tokens.extend(self._market_to_tokens.get(market_id, {}).values())
+
+        if not all_tokens:
+            return
+
+        batches = await self._send_token_batches(all_tokens)
+        console.print(
+            f"[cyan]Resubscribed {len(self._subscribed_markets)} markets "
+            f"({len(all_tokens)} tokens in {batches} batches)[/cyan]"
+        )
 
     async def _safe_callback(self, callback: Callable, *args) -> None:
         """Safely call a callback, catching any exceptions."""
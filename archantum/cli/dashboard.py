@@ -3,7 +3,10 @@
 from __future__ import annotations
 
 import asyncio
+import json
 from datetime import datetime
+
+import orjson
 from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
@@ -250,15 +253,18 @@ class Dashboard:
 
     def _format_alert_value(self, alert: Alert) -> str:
         """Format the value column based on alert type."""
-        import json
-
         if not alert.details:
             return "-"
 
         try:
-            details = json.loads(alert.details)
-        except json.JSONDecodeError:
-            return "-"
+            details = orjson.loads(alert.details)
+        except orjson.JSONDecodeError:
+            # Details are written with stdlib json, which may emit NaN or
+            # Infinity; orjson rejects those, so let stdlib json retry
+            try:
+                details = json.loads(alert.details)
+            except json.JSONDecodeError:
+                return "-"
 
         if alert.alert_type == "arbitrage":
             return f"{details.get('arbitrage_pct', 0):.1f}%"
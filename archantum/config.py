@@ -35,6 +35,9 @@ class Settings(BaseSettings):
 
     # Database
     database_path: Path = Field(default=Path("archantum.db"))
+    db_pool_size: int = Field(default=20, description="Persistent connections kept in the DB pool")
+    db_max_overflow: int = Field(default=20, description="Extra DB connections allowed under burst load")
+    db_busy_timeout: float = Field(default=30.0, description="Seconds to wait on a locked SQLite database")
 
     # Analysis windows
     price_move_intervals: int = Field(default=120, description="Intervals to look back for price moves")
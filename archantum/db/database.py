@@ -6,7 +6,9 @@ import json
 from datetime import datetime, timedelta
 from typing import Any
 
-from sqlalchemy import select, func, delete
+from sqlalchemy import select, func, delete, update, case, insert, event, inspect, text
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.schema import CreateColumn
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
 
 from archantum.config import settings
@@ -18,17 +20,101 @@ from archantum.api.clob import PriceData
 class Database:
     """Database operations manager."""
 
+    # Prepared statements kept per SQLite connection (sqlite3 default: 128)
+    STATEMENT_CACHE_SIZE = 512
+    # Compiled Core/ORM statements kept by the engine (SQLAlchemy default: 500)
+    QUERY_CACHE_SIZE = 1200
+
     def __init__(self, database_url: str | None = None):
         self.database_url = database_url or settings.database_url
-        self.engine = create_async_engine(self.database_url, echo=False)
+        engine_kwargs: dict[str, Any] = {
+            "echo": False,
+            "pool_pre_ping": True,
+            "pool_recycle": 300,
+            "query_cache_size": self.QUERY_CACHE_SIZE,
+            "connect_args": {
+                "timeout": settings.db_busy_timeout,
+                "cached_statements": self.STATEMENT_CACHE_SIZE,
+            },
+        }
+        if ":memory:" not in self.database_url:
+            # File-backed DB: size the pool for the concurrent fan-outs
+            engine_kwargs["pool_size"] = settings.db_pool_size
+            engine_kwargs["max_overflow"] = settings.db_max_overflow
+        self.engine = create_async_engine(self.database_url, **engine_kwargs)
+        event.listen(self.engine.sync_engine, "connect", self._set_sqlite_pragmas)
         self.async_session = async_sessionmaker(
             self.engine, class_=AsyncSession, expire_on_commit=False
         )
 
+    @staticmethod
+    def _set_sqlite_pragmas(dbapi_conn, _record) -> None:
+        """Let readers run alongside the writer instead of queueing on the file lock."""
+        cursor = dbapi_conn.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.close()
+
     async def init_db(self):
         """Initialize database tables."""
         async with self.engine.begin() as conn:
             await conn.run_sync(Base.metadata.create_all)
+            # create_all skips tables that already exist, so add any columns
+            # and indexes introduced after a table was first created
+            await conn.run_sync(self._add_missing_columns)
+            await conn.run_sync(self._close_duplicate_active_arbitrage)
+            await conn.run_sync(self._create_missing_indexes)
+
+    @staticmethod
+    def _add_missing_columns(conn) -> None:
+        """Add nullable model columns that are missing from existing tables."""
+        inspector = inspect(conn)
+        for table in Base.metadata.sorted_tables:
+            existing = {col["name"] for col in inspector.get_columns(table.name)}
+            for column in table.columns:
+                if column.name in existing or not column.nullable:
+                    continue
+                ddl = CreateColumn(column).compile(dialect=conn.dialect)
+                conn.execute(text(f'ALTER TABLE "{table.name}" ADD COLUMN {ddl}'))
+
+    @staticmethod
+    def _close_duplicate_active_arbitrage(conn) -> None:
+        """Close all but the newest active arbitrage row per market.
+
+        Databases created before ux_arb_tracking_market_active may hold
+        several active rows for one market, which would make creating that
+        unique index fail. Older duplicates are closed as of when they were
+        last seen.
+        """
+        indexes = {ix["name"] for ix in inspect(conn).get_indexes("arbitrage_tracking")}
+        if "ux_arb_tracking_market_active" in indexes:
+            return
+        conn.execute(text(
+            """
+            UPDATE arbitrage_tracking
+            SET disappeared_at = COALESCE(still_available_at, detected_at),
+                lifespan_seconds = (
+                    julianday(COALESCE(still_available_at, detected_at))
+                    - julianday(detected_at)
+                ) * 86400.0
+            WHERE disappeared_at IS NULL
+              AND EXISTS (
+                SELECT 1 FROM arbitrage_tracking AS newer
+                WHERE newer.market_id = arbitrage_tracking.market_id
+                  AND newer.disappeared_at IS NULL
+                  AND (newer.detected_at > arbitrage_tracking.detected_at
+                       OR (newer.detected_at = arbitrage_tracking.detected_at
+                           AND newer.id > arbitrage_tracking.id))
+              )
+            """
+        ))
+
+    @staticmethod
+    def _create_missing_indexes(conn) -> None:
+        """Create model indexes that are missing from existing tables."""
+        for table in Base.metadata.sorted_tables:
+            for index in table.indexes:
+                index.create(conn, checkfirst=True)
 
     async def get_system_state(self, key: str) -> str | None:
         """Get a system state value by key."""
@@ -164,6 +250,15 @@ class Database:
             await session.refresh(snapshot)
             return snapshot
 
+    async def save_price_snapshots_batch(self, rows: list[dict[str, Any]]) -> int:
+        """Save many price snapshots in a single executemany INSERT."""
+        if not rows:
+            return 0
+        async with self.async_session() as session:
+            await session.execute(insert(PriceSnapshot), rows)
+            await session.commit()
+            return len(rows)
+
     async def save_volume_snapshot(
         self,
         market_id: str,
@@ -212,6 +307,60 @@ class Database:
             result = await session.execute(query)
             return list(result.scalars().all())
 
+    async def get_latest_price_snapshots(
+        self, market_ids: list[str]
+    ) -> dict[str, PriceSnapshot]:
+        """Get the most recent price snapshot for many markets, keyed by market ID."""
+        if not market_ids:
+            return {}
+
+        async with self.async_session() as session:
+            latest = (
+                select(
+                    PriceSnapshot.market_id,
+                    func.max(PriceSnapshot.timestamp).label("latest_ts"),
+                )
+                .where(PriceSnapshot.market_id.in_(market_ids))
+                .group_by(PriceSnapshot.market_id)
+                .subquery()
+            )
+            result = await session.execute(
+                select(PriceSnapshot).join(
+                    latest,
+                    (PriceSnapshot.market_id == latest.c.market_id)
+                    & (PriceSnapshot.timestamp == latest.c.latest_ts),
+                )
+            )
+            return {snapshot.market_id: snapshot for snapshot in result.scalars().all()}
+
+    async def get_price_moving_averages(
+        self,
+        market_ids: list[str],
+        windows_hours: list[int],
+    ) -> dict[str, list[float | None]]:
+        """Get average yes prices over trailing windows (in windows_hours order), keyed by market ID."""
+        if not market_ids:
+            return {}
+
+        now = datetime.utcnow()
+        cutoffs = [now - timedelta(hours=hours) for hours in windows_hours]
+
+        async with self.async_session() as session:
+            result = await session.execute(
+                select(
+                    PriceSnapshot.market_id,
+                    *[
+                        func.avg(case((PriceSnapshot.timestamp >= cutoff, PriceSnapshot.yes_price)))
+                        for cutoff in cutoffs
+                    ],
+                )
+                .where(PriceSnapshot.market_id.in_(market_ids))
+                .where(PriceSnapshot.timestamp >= min(cutoffs))
+                .where(PriceSnapshot.yes_price.isnot(None))
+                .group_by(PriceSnapshot.market_id)
+            )
+            return {row[0]: list(row[1:]) for row in result.all()}
+
     async def save_alert(
         self,
         market_id: str,
@@ -840,31 +989,46 @@ class Database:
     ) -> int:
         """Batch-save trades for a wallet. Returns count of new trades inserted.
 
-        Fetches existing tx hashes in one query, filters dupes in-memory,
-        inserts all new trades in a single commit, and updates wallet stats once.
+        Looks up the batch's existing tx hashes in one query, filters dupes
+        in-memory, inserts all new trades with one INSERT ... ON CONFLICT DO NOTHING,
+        and updates wallet stats once.
         """
         if not trades_data:
             return 0
 
         async with self.async_session() as session:
-            # Fetch all existing tx hashes for this wallet in one query
+            # Only this batch's hashes, not the wallet's whole history
             result = await session.execute(
-                select(SmartTrade.transaction_hash)
-                .where(SmartTrade.wallet_id == wallet_id)
+                select(SmartTrade.transaction_hash).where(
+                    SmartTrade.transaction_hash.in_(
+                        [td["transaction_hash"] for td in trades_data]
+                    )
+                )
             )
-            existing_hashes: set[str] = {row[0] for row in result.all()}
+            existing_hashes = set(result.scalars().all())
 
             # Filter out duplicates in-memory
-            new_trades = []
+            new_rows = []
             for td in trades_data:
                 if td["transaction_hash"] not in existing_hashes:
                     existing_hashes.add(td["transaction_hash"])  # prevent intra-batch dupes
-                    new_trades.append(SmartTrade(wallet_id=wallet_id, **td))
+                    new_rows.append({"wallet_id": wallet_id, **td})
 
-            if not new_trades:
+            if not new_rows:
                 return 0
 
-            session.add_all(new_trades)
+            # One multi-row INSERT. Hashes already saved under another wallet
+            # (e.g. both sides of a trade between tracked wallets) are skipped
+            # instead of failing the whole batch.
+            result = await session.execute(
+                sqlite_insert(SmartTrade)
+                .on_conflict_do_nothing(index_elements=["transaction_hash"])
+                .returning(SmartTrade.timestamp),
+                new_rows,
+            )
+            inserted_timestamps = result.scalars().all()
+            if not inserted_timestamps:
+                return 0
 
             # Update wallet last_trade_at and total_trades once
             wallet_result = await session.execute(
@@ -872,13 +1036,13 @@ class Database:
             )
             wallet = wallet_result.scalar_one_or_none()
             if wallet:
-                latest_ts = max(t.timestamp for t in new_trades)
+                latest_ts = max(inserted_timestamps)
                 if wallet.last_trade_at is None or latest_ts > wallet.last_trade_at:
                     wallet.last_trade_at = latest_ts
-                wallet.total_trades = (wallet.total_trades or 0) + len(new_trades)
+                wallet.total_trades = (wallet.total_trades or 0) + len(inserted_timestamps)
 
             await session.commit()
-            return len(new_trades)
+            return len(inserted_timestamps)
 
     async def get_recent_smart_trades(
         self,
@@ -918,14 +1082,20 @@ class Database:
 
     async def mark_trade_alerted(self, trade_id: int) -> None:
         """Mark a trade as alerted."""
+        await self.mark_trades_alerted([trade_id])
+
+    async def mark_trades_alerted(self, trade_ids: list[int]) -> None:
+        """Mark many trades as alerted in a single UPDATE."""
+        if not trade_ids:
+            return
         async with self.async_session() as session:
-            result = await session.execute(
-                select(SmartTrade).where(SmartTrade.id == trade_id)
+            await session.execute(
+                update(SmartTrade)
+                .where(SmartTrade.id.in_(trade_ids))
+                .values(alert_sent=True)
+                .execution_options(synchronize_session=False)
             )
-            trade = result.scalar_one_or_none()
-            if trade:
-                trade.alert_sent = True
-                await session.commit()
+            await session.commit()
 
     async def get_wallet_trades(
         self,
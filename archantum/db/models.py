@@ -10,6 +10,8 @@ from sqlalchemy import (
     DateTime,
     Text,
     ForeignKey,
+    Index,
+    text,
 )
 from sqlalchemy.orm import DeclarativeBase, relationship
 
@@ -47,6 +49,10 @@ class PriceSnapshot(Base):
     """Price snapshots table."""
 
     __tablename__ = "price_snapshots"
+    # Covers latest/windowed yes_price lookups per market without touching the table
+    __table_args__ = (
+        Index("ix_price_snapshots_market_ts_yes", "market_id", "timestamp", "yes_price"),
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     market_id = Column(String, ForeignKey("markets.id"), nullable=False)
@@ -68,6 +74,7 @@ class VolumeSnapshot(Base):
     """Volume snapshots table."""
 
     __tablename__ = "volume_snapshots"
+    __table_args__ = (Index("ix_volume_snapshots_market_ts", "market_id", "timestamp"),)
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     market_id = Column(String, ForeignKey("markets.id"), nullable=False)
@@ -206,6 +213,7 @@ class SmartTrade(Base):
     size = Column(Float, nullable=False)  # Token amount
     usdc_size = Column(Float, nullable=False)  # USD value
     price = Column(Float, nullable=False)
+    category = Column(String, nullable=True)  # Inferred from market_title at ingest
 
     # Timestamps
     timestamp = Column(DateTime, nullable=False)
@@ -362,6 +370,7 @@ class MarketScore(Base):
     """Market scoring and ranking (0-100 scale)."""
 
     __tablename__ = "market_scores"
+    __table_args__ = (Index("ix_market_scores_market_ts", "market_id", "timestamp"),)
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     market_id = Column(String, ForeignKey("markets.id"), nullable=False)
@@ -387,6 +396,15 @@ class ArbitrageTracking(Base):
     """Speed tracking for arbitrage opportunities."""
 
     __tablename__ = "arbitrage_tracking"
+    # At most one still-active opportunity per market; also the upsert target
+    __table_args__ = (
+        Index(
+            "ux_arb_tracking_market_active",
+            "market_id",
+            unique=True,
+            sqlite_where=text("disappeared_at IS NULL"),
+        ),
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     market_id = Column(String, nullable=False)
@@ -251,9 +251,21 @@ class PollingEngine:
             for market_id, price_result in all_price_results.items():
                 all_prices[market_id] = price_result.to_price_data()
 
-            # 5. Save price snapshots with source tracking
-            for market_id, price_result in all_price_results.items():
-                await self._save_price_snapshot_with_source(price_result)
+            # 5. Save price snapshots with source tracking (one batched INSERT)
+            await self.db.save_price_snapshots_batch([
+                {
+                    "market_id": pr.market_id,
+                    "yes_price": pr.yes_price,
+                    "no_price": pr.no_price,
+                    "yes_bid": pr.yes_bid,
+                    "yes_ask": pr.yes_ask,
+                    "no_bid": pr.no_bid,
+                    "no_ask": pr.no_ask,
+                    "spread": pr.spread,
+                    "source": pr.source,
+                }
+                for pr in all_price_results.values()
+            ])
 
             # 6. Run analysis
             console.print("[cyan]Running analysis...[/cyan]")
@@ -783,25 +795,6 @@ class PollingEngine:
 
         return all_prices
 
-    async def _save_price_snapshot_with_source(self, price_result: "PriceResult") -> None:
-        """Save price snapshot with source tracking."""
-        from archantum.db.models import PriceSnapshot
-
-        async with self.db.async_session() as session:
-            snapshot = PriceSnapshot(
-                market_id=price_result.market_id,
-                yes_price=price_result.yes_price,
-                no_price=price_result.no_price,
-                yes_bid=price_result.yes_bid,
-                yes_ask=price_result.yes_ask,
-                no_bid=price_result.no_bid,
-                no_ask=price_result.no_ask,
-                spread=price_result.spread,
-                source=price_result.source,
-            )
-            session.add(snapshot)
-            await session.commit()
-
     async def _fetch_rest_prices_for_validation(
         self,
         markets: list[GammaMarket],
@@ -1138,11 +1131,20 @@ async def run_test_alert():
     await db.close()
 
 
+def _use_uvloop() -> None:
+    """Run asyncio on uvloop when it is installed (the `speed` extra)."""
+    try:
+        import uvloop
+    except ImportError:
+        return
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+
 @click.group()
 @click.version_option(version="0.2.0", prog_name="archantum")
 def cli():
     """Archantum - Polymarket Data Analysis Agent."""
-    pass
+    _use_uvloop()
 
 
 @cli.command()
@@ -1182,6 +1184,8 @@ def status():
         # Data engine status
         console.print("\n[bold cyan]Data Engine[/bold cyan]")
         console.print(f"WebSocket: {'Enabled' if settings.ws_enabled else 'Disabled'}")
+        event_loop = "uvloop" if type(asyncio.get_running_loop()).__module__.startswith("uvloop") else "asyncio"
+        console.print(f"Event loop: {event_loop}")
         console.print(f"Technical Analysis: {'Enabled' if settings.ta_enabled else 'Disabled'}")
         console.print(f"TA Frequency: Every {settings.ta_poll_frequency} polls")
         console.print(f"Confluence Threshold: {settings.confluence_alert_threshold}")